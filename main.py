@@ -63,7 +63,7 @@ from src.core import download_needed_files
 from src.fastflags import apply_fastflags, remove_fastflags
 from src.assets import download_and_prepare_assets, apply_skybox_fix, get_cache_info
 from src.first_run import show_first_run_setup, is_first_run, get_license_key, save_license_key, remove_license_key, check_for_updates_on_startup
-from src.admin import is_admin, check_admin_with_dialog, check_and_display_admin_status
+from src.admin import is_admin, prompt_for_admin, check_admin_with_dialog, check_and_display_admin_status
 from src.keysys import startup_license_validation, check_premium_status
 
 
@@ -937,32 +937,30 @@ class SettingsTab(QWidget):
         """Update the status of modifications"""
         try:
             # Check skybox fix status
-            from src.fastflags import is_skybox_fix_active, is_no_arms_fix_active
+            from src.fastflags import skybox_fix_active, no_arms_fix_active
             
-            skybox_status = is_skybox_fix_active()
-            if skybox_status["success"]:
-                if skybox_status["active"]:
-                    self.skybox_status_label.setText("✅ Skybox Fix: Active")
-                    self.skybox_status_label.setStyleSheet("color: #4CAF50;")
-                else:
-                    self.skybox_status_label.setText("❌ Skybox Fix: Inactive")
-                    self.skybox_status_label.setStyleSheet("color: #F44336;")
-            else:
+            skybox_active = skybox_fix_active()
+            if skybox_active is None:
                 self.skybox_status_label.setText("⚠️ Skybox Fix: Error checking status")
                 self.skybox_status_label.setStyleSheet("color: #FF9800;")
+            elif skybox_active:
+                self.skybox_status_label.setText("✅ Skybox Fix: Active")
+                self.skybox_status_label.setStyleSheet("color: #4CAF50;")
+            else:
+                self.skybox_status_label.setText("❌ Skybox Fix: Inactive")
+                self.skybox_status_label.setStyleSheet("color: #F44336;")
             
             # Check no arms fix status
-            no_arms_status = is_no_arms_fix_active()
-            if no_arms_status["success"]:
-                if no_arms_status["active"]:
-                    self.no_arms_status_label.setText("✅ No Arms Fix: Active")
-                    self.no_arms_status_label.setStyleSheet("color: #4CAF50;")
-                else:
-                    self.no_arms_status_label.setText("❌ No Arms Fix: Inactive")
-                    self.no_arms_status_label.setStyleSheet("color: #F44336;")
-            else:
+            no_arms_active = no_arms_fix_active()
+            if no_arms_active is None:
                 self.no_arms_status_label.setText("⚠️ No Arms Fix: Error checking status")
                 self.no_arms_status_label.setStyleSheet("color: #FF9800;")
+            elif no_arms_active:
+                self.no_arms_status_label.setText("✅ No Arms Fix: Active")
+                self.no_arms_status_label.setStyleSheet("color: #4CAF50;")
+            else:
+                self.no_arms_status_label.setText("❌ No Arms Fix: Inactive")
+                self.no_arms_status_label.setStyleSheet("color: #F44336;")
                 
         except Exception as e:
             self.skybox_status_label.setText("⚠️ Skybox Fix: Error loading status")
@@ -2206,19 +2204,20 @@ class ToolsTab(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                from src.fastflags import remove_fastflags, remove_skybox_fastflag, is_skybox_fix_active
+                from src.fastflags import remove_fastflags, remove_skybox_fastflag, skybox_fix_active, writable_ixp
                 
                 # Check if skybox fix is active and remove it properly
-                skybox_status = is_skybox_fix_active()
                 skybox_removed = False
                 
-                if skybox_status["success"] and skybox_status["active"]:
-                    skybox_result = remove_skybox_fastflag()
-                    if skybox_result["success"]:
-                        skybox_removed = True
-                
-                # Remove any other CDBL fastflags
-                result = remove_fastflags()
+                # Both removals save IxpSettings.json; toggle readonly only once
+                with writable_ixp():
+                    if skybox_fix_active():
+                        skybox_result = remove_skybox_fastflag()
+                        if skybox_result["success"]:
+                            skybox_removed = True
+                    
+                    # Remove any other CDBL fastflags
+                    result = remove_fastflags()
                 
                 # Report results
                 if result["success"] or skybox_removed:
@@ -3629,6 +3628,7 @@ class CDBlauncher(QMainWindow):
         super().__init__()
         self.setWindowFlags(Qt.FramelessWindowHint)  # Remove default window frame
         self.setAttribute(Qt.WA_TranslucentBackground, False)
+        self.premium_tab = None  # Set in init_ui
         self.init_ui()
         self.apply_styles()
         
@@ -4334,7 +4334,7 @@ class CDBlauncher(QMainWindow):
                 if validation_result["premium_enabled"]:
                     print("✅ Premium access validated - Features available")
                     # Update UI to reflect premium status if needed
-                    if hasattr(self, 'premium_tab'):
+                    if self.premium_tab is not None:
                         # Refresh premium tab to show available features
                         self.premium_tab.refresh_premium_status()
                     if hasattr(self, 'modifications_tab'):
@@ -4360,7 +4360,7 @@ class CDBlauncher(QMainWindow):
     def closeEvent(self, event):
         """Handle window closing - cleanup temporary files"""
         # Clean up premium tab temp files
-        if hasattr(self, 'premium_tab'):
+        if self.premium_tab is not None:
             self.premium_tab.cleanup_temp_files()
         event.accept()
 
@@ -4380,43 +4380,8 @@ def main():
     # app.setWindowIcon(QIcon("icon.ico"))
     
     # Check for admin privileges FIRST - before any other setup
-    if not is_admin():
-        print("Administrator privileges required. Attempting to restart with elevation...")
-        try:
-            # Get the correct executable path
-            if getattr(sys, 'frozen', False):
-                # Running as PyInstaller EXE
-                exe_path = sys.executable
-                # Use ShellExecute to restart with admin privileges
-                import ctypes
-                ctypes.windll.shell32.ShellExecuteW(
-                    None,
-                    "runas",  # Request elevation
-                    exe_path,
-                    "",  # No arguments needed
-                    None,
-                    1  # SW_SHOW
-                )
-            else:
-                # Running as Python script
-                python_exe = sys.executable
-                script_path = sys.argv[0]
-                import ctypes
-                ctypes.windll.shell32.ShellExecuteW(
-                    None,
-                    "runas",  # Request elevation
-                    python_exe,
-                    f'"{script_path}"',
-                    None,
-                    1  # SW_SHOW
-                )
-            
-            # Exit the current non-admin instance
-            sys.exit(0)
-            
-        except Exception as e:
-            print(f"Failed to restart with admin privileges: {e}")
-            print("Continuing without admin privileges - some features may not work properly.")
+    if not prompt_for_admin():
+        print("Continuing without admin privileges - some features may not work properly.")
     
     # Check for first run and show setup if needed
     if is_first_run():
@@ -131,7 +131,13 @@ def check_and_display_admin_status(parent=None):
         print("⚠️ Running without administrator privileges")
         
         # Import here to avoid circular imports
-        from PySide6.QtWidgets import QMessageBox
+        from src.first_run import get_show_admin_warning, set_show_admin_warning
+
+        # User opted out of the popup - console message is enough
+        if not get_show_admin_warning():
+            return False
+
+        from PySide6.QtWidgets import QMessageBox, QCheckBox
         
         # Show informational message (non-blocking)
         msg_box = QMessageBox(parent)
@@ -144,6 +150,11 @@ def check_and_display_admin_status(parent=None):
         )
         msg_box.setStandardButtons(QMessageBox.Ok)
         msg_box.setModal(False)  # Non-blocking
+
+        # Let the user skip this popup on later launches
+        dont_show_checkbox = QCheckBox("Don't show this again")
+        dont_show_checkbox.toggled.connect(lambda checked: set_show_admin_warning(not checked))
+        msg_box.setCheckBox(dont_show_checkbox)
         
         # Show and close automatically after 3 seconds
         msg_box.show()
@@ -7,21 +7,92 @@ import os
 import json
 import zipfile
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import hashlib
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
+# BLAKE3 is optional - local identity checks fall back to hashlib's BLAKE2b
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Read/write size for downloads and hashing
+CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# (connect_timeout, read_timeout) for asset downloads
+REQUEST_TIMEOUT = (5, 60)
+
+# Environment lookups are stable for the life of the process
+LOCALAPPDATA = os.getenv('LOCALAPPDATA')
+TEMP_DIR = os.getenv('TEMP')
+
+# Global session so parallel downloads share pooled connections (the lock
+# makes sure concurrent first calls still create only one)
+_session = None
+_session_lock = threading.Lock()
+
+# FastFlags applied alongside the skybox asset swaps
+SKYBOX_FIX_FLAGS = {
+    "FFlagRenderSkyboxUseIBL": "False",
+    "FFlagRenderSkyboxUseEnvMap": "False"
+}
+
+# In-memory copy of archives/_index.json, keyed by the extraction marker's mtime
+_extracted_index = None
+
+# Roblox cache directory once it has been found. A miss is never remembered and
+# a hit is re-checked with one stat, so Roblox (re)installs are picked up
+_path_cache = {}
+
+def get_session():
+    """Get or create the shared requests session for asset downloads"""
+    global _session
+    if _session is not None:
+        return _session
+    
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            
+            # Enough pooled connections for the parallel archive downloads, with retries
+            adapter = HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=8,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+            )
+            session.mount('https://', adapter)
+            
+            # Set user agent
+            session.headers.update({
+                'User-Agent': 'CDBL/2.0 (Windows; requests)'
+            })
+            
+            # Only publish the session once it is fully configured
+            _session = session
+    return _session
+
 def get_assets_cache_path():
     """Get the path to CDBL assets cache directory"""
-    appdata = os.getenv('LOCALAPPDATA')
-    cache_dir = os.path.join(appdata, 'CDBL', 'assets_cache')
-    os.makedirs(cache_dir, exist_ok=True)
+    cache_dir = os.path.join(LOCALAPPDATA, 'CDBL', 'assets_cache')
+    # Recreate the folder if it was deleted while CDBL is running
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir, exist_ok=True)
     return cache_dir
 
 def get_roblox_cache_path():
     """Get the path to Roblox cache directory"""
-    appdata = os.getenv('LOCALAPPDATA')
-    temp_dir = os.getenv('TEMP')
+    cached = _path_cache.get('roblox_cache')
+    if cached and os.path.exists(cached):
+        return cached
+    
+    appdata = LOCALAPPDATA
+    temp_dir = TEMP_DIR
     
     # Try multiple possible Roblox cache locations
     possible_paths = [
@@ -37,15 +108,17 @@ def get_roblox_cache_path():
     
     for path in possible_paths:
         if os.path.exists(path):
+            _path_cache['roblox_cache'] = path
             return path
     
-    # Return the most common path even if it doesn't exist
+    # Return the most common path even if it doesn't exist (not remembered,
+    # Roblox may create its cache later in this session)
     return os.path.join(temp_dir, 'Roblox', 'http')
 
 def check_roblox_installation():
     """Check if Roblox is installed and return installation info"""
-    appdata = os.getenv('LOCALAPPDATA')
-    temp_dir = os.getenv('TEMP')
+    appdata = LOCALAPPDATA
+    temp_dir = TEMP_DIR
     
     # Check for Roblox directories in both AppData and Temp
     roblox_dirs = []
@@ -69,20 +142,85 @@ def check_roblox_installation():
         "cache_exists": os.path.exists(cache_path)
     }
 
+def write_response_to_file(response, destination):
+    """Stream a response body to disk through the C-level copyfileobj loop"""
+    # Let urllib3 undo any gzip/deflate transfer encoding while reading
+    response.raw.decode_content = True
+    with open(destination, 'wb') as f:
+        shutil.copyfileobj(response.raw, f, length=CHUNK_SIZE)
+
 def download_file(url, destination):
     """Download a file from URL to destination"""
     try:
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
-        
-        with open(destination, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        with get_session().get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+            write_response_to_file(response, destination)
         return True
     except Exception as e:
         print(f"Error downloading {url}: {e}")
         return False
 
+def download_file_if_modified(url, destination, validators=None):
+    """
+    Download a file unless the server reports it unchanged since the last download
+    
+    Args:
+        url: URL to download
+        destination: Path to write the file to
+        validators: ETag/Last-Modified recorded for this URL on a previous download
+    
+    Returns:
+        dict: Result with success, modified flag and the new validators
+    """
+    result = {
+        "success": False,
+        "modified": True,
+        "etag": None,
+        "last_modified": None
+    }
+    
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    
+    try:
+        with get_session().get(url, stream=True, headers=headers, timeout=REQUEST_TIMEOUT) as response:
+            if response.status_code == 304:
+                result["success"] = True
+                result["modified"] = False
+                result["etag"] = validators.get("etag")
+                result["last_modified"] = validators.get("last_modified")
+                return result
+            response.raise_for_status()
+            write_response_to_file(response, destination)
+            
+            result["success"] = True
+            result["etag"] = response.headers.get("ETag")
+            result["last_modified"] = response.headers.get("Last-Modified")
+    except Exception as e:
+        print(f"Error downloading {url}: {e}")
+    return result
+
+def load_json_file(path):
+    """Load a small JSON bookkeeping file, returning an empty dict if missing or invalid"""
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_json_file(path, data):
+    """Save a small JSON bookkeeping file"""
+    try:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+    except OSError as e:
+        print(f"Warning: Could not write {path}: {e}")
+
 def download_assets_json():
     """Download the assets.json file"""
     cache_dir = get_assets_cache_path()
@@ -113,60 +251,176 @@ def download_archive_files():
         'https://github.com/gastrophobic/Rivals-dump/raw/refs/heads/main/archive_003.zip'
     ]
     
+    # ETag/Last-Modified per URL, plus what was extracted from each archive.
+    # The marker lives inside extract_dir so deleting the assets forces a full download.
+    meta_path = os.path.join(archives_dir, '_meta.json')
+    marker_path = os.path.join(extract_dir, '_extracted_marker.json')
+    archive_meta = load_json_file(meta_path)
+    extracted_marker = load_json_file(marker_path)
+    
+    # Fetch and extract the archives concurrently - each worker opens its own zip
+    # and only touches its own keys in archive_meta/extracted_marker
+    with ThreadPoolExecutor(max_workers=len(archive_urls)) as executor:
+        per_archive_files = list(executor.map(
+            lambda url: download_and_extract_archive(url, archives_dir, extract_dir, archive_meta, extracted_marker),
+            archive_urls
+        ))
+    
+    save_json_file(meta_path, archive_meta)
+    save_json_file(marker_path, extracted_marker)
+    
+    extracted_files = [path for files in per_archive_files for path in files]
+    save_extracted_index(archives_dir, extract_dir, extracted_files)
+    
+    print(f"Total extracted files in unified folder: {len(extracted_files)}")
+    return extracted_files
+
+def get_central_directory_hash(zip_ref):
+    """Hash the names, CRCs and sizes listed in a zip's central directory"""
+    digest = hashlib.sha256()
+    for info in zip_ref.infolist():
+        digest.update(f"{info.filename}\0{info.CRC}\0{info.file_size}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+def download_and_extract_archive(url, archives_dir, extract_dir, archive_meta=None, extracted_marker=None):
+    """
+    Download one archive zip, extract it into extract_dir and return the extracted file paths
+    
+    Args:
+        url: Archive URL
+        archives_dir: Directory the zip is downloaded to
+        extract_dir: Unified extraction directory
+        archive_meta: URL -> ETag/Last-Modified dict, updated in place
+        extracted_marker: Archive name -> central directory hash and files, updated in place
+    
+    Returns:
+        list: Paths of the files extracted (or already present) from this archive
+    """
+    if archive_meta is None:
+        archive_meta = {}
+    if extracted_marker is None:
+        extracted_marker = {}
+    
+    filename = os.path.basename(urlparse(url).path)
+    zip_path = os.path.join(archives_dir, filename)
     extracted_files = []
+    previous = extracted_marker.get(filename)
+    # Files left on disk by the last successful extraction of this archive
+    previous_files = [os.path.join(extract_dir, rel_path) for rel_path in previous["files"]] if previous else []
     
-    for url in archive_urls:
-        filename = os.path.basename(urlparse(url).path)
-        zip_path = os.path.join(archives_dir, filename)
-        
-        # Download the zip file
-        if download_file(url, zip_path):
-            # Extract the zip file to the single extraction directory
-            try:
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    # Extract all files to the single directory
-                    for member in zip_ref.namelist():
-                        # Extract the file
-                        zip_ref.extract(member, extract_dir)
-                        extracted_file_path = os.path.join(extract_dir, member)
-                        
-                        # Only add files (not directories) to the list
-                        if os.path.isfile(extracted_file_path):
-                            extracted_files.append(extracted_file_path)
+    # Only ask for a conditional download if this archive's files are still extracted
+    download = download_file_if_modified(url, zip_path, archive_meta.get(url) if previous else None)
+    if not download["success"]:
+        # Keep the earlier extraction in the index - those files are still usable
+        return previous_files
+    
+    validators = {"etag": download["etag"], "last_modified": download["last_modified"]}
+    if not download["modified"]:
+        print(f"{filename} is up to date, skipping download")
+        return previous_files
+    
+    # Extract the zip file to the single extraction directory
+    created_dirs = {extract_dir}
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            central_directory_hash = get_central_directory_hash(zip_ref)
+            unchanged = previous is not None and previous.get("central_directory") == central_directory_hash
+            
+            # Stream every file member straight into the single directory,
+            # unless the same contents were already extracted last time
+            for info in ([] if unchanged else zip_ref.infolist()):
+                # Skip directories and macOS metadata
+                if info.is_dir() or info.filename.startswith('__MACOSX/') or info.filename.endswith('.DS_Store'):
+                    continue
                 
-                # Remove the zip file after extraction
-                os.remove(zip_path)
-                print(f"Extracted {filename} to unified assets folder")
+                extracted_file_path = os.path.normpath(os.path.join(extract_dir, info.filename))
+                # Never write outside the extraction directory
+                if not extracted_file_path.startswith(os.path.join(extract_dir, '')):
+                    continue
                 
-            except Exception as e:
-                print(f"Error extracting {zip_path}: {e}")
-                continue
+                # Archives are mostly flat, so only nested members need a makedirs
+                parent_dir = os.path.dirname(extracted_file_path)
+                if parent_dir not in created_dirs:
+                    os.makedirs(parent_dir, exist_ok=True)
+                    created_dirs.add(parent_dir)
+                
+                with zip_ref.open(info) as src, open(extracted_file_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, length=CHUNK_SIZE)
+                extracted_files.append(extracted_file_path)
+        
+        if unchanged:
+            extracted_files = previous_files
+        else:
+            extracted_marker[filename] = {
+                "central_directory": central_directory_hash,
+                "files": [os.path.relpath(path, extract_dir) for path in extracted_files]
+            }
+        # Only remember the validators once the archive's files are in place
+        archive_meta[url] = validators
+        
+        # Remove the zip file after extraction
+        os.remove(zip_path)
+        if unchanged:
+            print(f"{filename} is unchanged, skipping extraction")
+        else:
+            print(f"Extracted {filename} to unified assets folder")
+        
+    except Exception as e:
+        print(f"Error extracting {zip_path}: {e}")
+        # Index whatever is on disk now: the old files plus any newly written ones
+        extracted_files = list(dict.fromkeys(previous_files + extracted_files))
     
-    print(f"Total extracted files in unified folder: {len(extracted_files)}")
     return extracted_files
 
+def iter_files(root):
+    """
+    Yield a DirEntry for every file under root
+    
+    os.scandir entries cache their type from the directory read, so this
+    avoids the extra stat calls os.walk makes for every directory.
+    
+    Args:
+        root: Directory to scan recursively
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
 def cleanup_old_archive_directories(archives_dir, extract_dir):
     """Remove old separate archive directories to consolidate into unified folder"""
     old_archive_names = ['archive_0004', 'archive_001', 'archive_002', 'archive_003']
+    created_dirs = {extract_dir}
     
     for archive_name in old_archive_names:
         old_dir = os.path.join(archives_dir, archive_name)
-        if os.path.exists(old_dir) and os.path.isdir(old_dir):
+        if os.path.isdir(old_dir):
             try:
                 # Move files from old directory to unified directory
-                for root, dirs, files in os.walk(old_dir):
-                    for file in files:
-                        old_file_path = os.path.join(root, file)
-                        # Create relative path structure in unified directory
-                        rel_path = os.path.relpath(old_file_path, old_dir)
-                        new_file_path = os.path.join(extract_dir, rel_path)
-                        
-                        # Create directory structure if needed
-                        os.makedirs(os.path.dirname(new_file_path), exist_ok=True)
-                        
-                        # Move file if it doesn't already exist
-                        if not os.path.exists(new_file_path):
-                            shutil.move(old_file_path, new_file_path)
+                for entry in list(iter_files(old_dir)):
+                    old_file_path = entry.path
+                    # Create relative path structure in unified directory
+                    rel_path = os.path.relpath(old_file_path, old_dir)
+                    new_file_path = os.path.join(extract_dir, rel_path)
+                    
+                    # Create directory structure if needed
+                    parent_dir = os.path.dirname(new_file_path)
+                    if parent_dir not in created_dirs:
+                        os.makedirs(parent_dir, exist_ok=True)
+                        created_dirs.add(parent_dir)
+                    
+                    # Move file if it doesn't already exist
+                    if not os.path.exists(new_file_path):
+                        shutil.move(old_file_path, new_file_path)
                 
                 # Remove the old directory
                 shutil.rmtree(old_dir)
@@ -177,25 +431,147 @@ def cleanup_old_archive_directories(archives_dir, extract_dir):
 
 def get_file_hash(file_path):
     """Get SHA256 hash of a file"""
-    sha256_hash = hashlib.sha256()
     try:
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+        with open(file_path, 'rb', buffering=0) as f:
+            # file_digest (Python 3.11+) runs the read/update loop in C
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+            
+            sha256_hash = hashlib.sha256()
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
                 sha256_hash.update(chunk)
-        return sha256_hash.hexdigest()
+            return sha256_hash.hexdigest()
+    except Exception:
+        return None
+
+def get_local_file_hash(file_path):
+    """
+    Get a fast content hash of a file for local identity comparisons
+    
+    The hashes in assets.json are SHA-256, so this must never be compared
+    against them - it only tells whether two local files hold the same bytes.
+    
+    Args:
+        file_path: Path of the file to hash
+    
+    Returns:
+        str: Hex digest, or None if the file could not be read
+    """
+    try:
+        if BLAKE3_AVAILABLE:
+            return blake3(max_threads=blake3.AUTO).update_mmap(file_path).hexdigest()
+        
+        with open(file_path, 'rb', buffering=0) as f:
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, 'blake2b').hexdigest()
+            
+            blake2b_hash = hashlib.blake2b()
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                blake2b_hash.update(chunk)
+            return blake2b_hash.hexdigest()
     except Exception:
         return None
 
-def find_asset_by_hash(target_hash, search_directory):
-    """Find a file in directory by its hash"""
-    for root, dirs, files in os.walk(search_directory):
-        for file in files:
-            file_path = os.path.join(root, file)
-            file_hash = get_file_hash(file_path)
-            if file_hash and file_hash.lower() == target_hash.lower():
-                return file_path
+def files_identical(first_path, second_path):
+    """Check whether two files have the same contents (size first, then local hash)"""
+    try:
+        if os.path.samefile(first_path, second_path):
+            return True
+        if os.path.getsize(first_path) != os.path.getsize(second_path):
+            return False
+    except OSError:
+        return False
+    first_hash = get_local_file_hash(first_path)
+    return first_hash is not None and first_hash == get_local_file_hash(second_path)
+
+def find_asset_by_hash(target_hash, search_directory, verify=False):
+    """
+    Find a file in directory by its hash
+    
+    Args:
+        target_hash: Hash of the asset to find
+        search_directory: Directory to search in
+        verify: Fall back to hashing every file's contents if no filename matches
+    
+    Returns:
+        str: Path to the matching file, or None if not found
+    """
+    # Assets are named after their hash, so a filename match is almost always enough
+    direct_path = os.path.join(search_directory, target_hash)
+    if os.path.isfile(direct_path):
+        return direct_path
+    
+    target_lower = target_hash.lower()
+    for entry in iter_files(search_directory):
+        if entry.name.lower() == target_lower:
+            return entry.path
+    
+    if not verify:
+        return None
+    
+    # Content hashing reads every byte of the asset store - only do it on request
+    for entry in iter_files(search_directory):
+        file_hash = get_file_hash(entry.path)
+        if file_hash and file_hash.lower() == target_lower:
+            return entry.path
     return None
 
+def get_marker_mtime(extract_dir):
+    """Get the extraction marker's mtime, or None if there is no marker"""
+    try:
+        return os.stat(os.path.join(extract_dir, '_extracted_marker.json')).st_mtime
+    except OSError:
+        return None
+
+def save_extracted_index(archives_dir, extract_dir, extracted_files):
+    """
+    Persist a lowercase filename -> relative path index of the extracted assets
+    
+    Args:
+        archives_dir: Directory holding _index.json
+        extract_dir: Unified extraction directory
+        extracted_files: Paths of every extracted asset
+    
+    Returns:
+        dict: The filename -> relative path index that was written
+    """
+    global _extracted_index
+    files = {}
+    for path in extracted_files:
+        files.setdefault(os.path.basename(path).lower(), os.path.relpath(path, extract_dir))
+    
+    marker_mtime = get_marker_mtime(extract_dir)
+    save_json_file(os.path.join(archives_dir, '_index.json'), {"marker_mtime": marker_mtime, "files": files})
+    _extracted_index = (marker_mtime, files)
+    return files
+
+def load_extracted_index():
+    """
+    Load the extracted asset index, rebuilding it if it is missing or stale
+    
+    Returns:
+        dict: Lowercase filename -> path relative to the extraction directory
+    """
+    global _extracted_index
+    archives_dir = os.path.join(get_assets_cache_path(), 'archives')
+    extract_dir = os.path.join(archives_dir, 'extracted_assets')
+    marker_mtime = get_marker_mtime(extract_dir)
+    
+    if _extracted_index is not None and _extracted_index[0] == marker_mtime:
+        return _extracted_index[1]
+    
+    saved = load_json_file(os.path.join(archives_dir, '_index.json'))
+    if saved.get("marker_mtime") == marker_mtime and isinstance(saved.get("files"), dict):
+        _extracted_index = (marker_mtime, saved["files"])
+        return saved["files"]
+    
+    # Missing or out of date - scan the extraction directory once
+    extracted_files = [
+        entry.path for entry in iter_files(extract_dir)
+        if entry.name != '_extracted_marker.json'
+    ]
+    return save_extracted_index(archives_dir, extract_dir, extracted_files)
+
 def find_replacement_asset(replacement_hash):
     """Find replacement asset in the unified extracted assets directory"""
     cache_dir = get_assets_cache_path()
@@ -204,12 +580,18 @@ def find_replacement_asset(replacement_hash):
     if not os.path.exists(extract_dir):
         return None
     
-    # Since assets are stored with their hash as filename, check directly
+    # Assets are stored with their hash as filename, so the index maps hash -> file
+    rel_path = load_extracted_index().get(replacement_hash.lower())
+    if rel_path:
+        asset_path = os.path.join(extract_dir, rel_path)
+        if os.path.isfile(asset_path):
+            return asset_path
+    
+    # The index can miss files (e.g. an archive that failed to update), so
+    # check the direct path and fall back to a case-insensitive search
     asset_path = os.path.join(extract_dir, replacement_hash)
-    if os.path.exists(asset_path):
+    if os.path.isfile(asset_path):
         return asset_path
-    
-    # Fallback to hash-based search if direct filename lookup fails
     return find_asset_by_hash(replacement_hash, extract_dir)
 
 def swap_asset(original_hash, replacement_hash):
@@ -244,12 +626,10 @@ def swap_asset(original_hash, replacement_hash):
 
     # Try to locate existing original asset in cache
     original_asset_path = None
-    for root, dirs, files in os.walk(roblox_cache):
-        for file in files:
-            if file == original_hash or file.lower() == original_hash.lower():
-                original_asset_path = os.path.join(root, file)
-                break
-        if original_asset_path:
+    target = original_hash.lower()
+    for entry in iter_files(roblox_cache):
+        if entry.name.lower() == target:
+            original_asset_path = entry.path
             break
 
     try:
@@ -257,14 +637,14 @@ def swap_asset(original_hash, replacement_hash):
             # Asset exists - create backup and replace
             backup_path = original_asset_path + '.cdbl_backup'
             if not os.path.exists(backup_path):
-                shutil.copy2(original_asset_path, backup_path)
-            shutil.copy2(replacement_asset_path, original_asset_path)
+                link_backup(original_asset_path, backup_path)
+            copy_into_place(replacement_asset_path, original_asset_path)
             result["message"] = f"Successfully swapped asset {original_hash} (original existed)"
         else:
             # Original not present - create the asset file in the cache
             destination_path = os.path.join(roblox_cache, original_hash)
             try:
-                shutil.copy2(replacement_asset_path, destination_path)
+                copy_into_place(replacement_asset_path, destination_path)
                 result["message"] = f"Placed replacement asset as new cache file for {original_hash} (original missing)"
             except Exception:
                 # If writing directly into the cache root fails (permissions/structure),
@@ -273,7 +653,7 @@ def swap_asset(original_hash, replacement_hash):
                     subdir = os.path.join(roblox_cache, 'cdbl_added')
                     os.makedirs(subdir, exist_ok=True)
                     dest2 = os.path.join(subdir, original_hash)
-                    shutil.copy2(replacement_asset_path, dest2)
+                    copy_into_place(replacement_asset_path, dest2)
                     result["message"] = f"Placed replacement asset into {subdir} for {original_hash} (original missing)"
                 except Exception as e:
                     raise
@@ -286,14 +666,74 @@ def swap_asset(original_hash, replacement_hash):
 
     return result
 
-def place_asset_in_cache(asset_hash, replacement_hash):
+def link_backup(original_path, backup_path):
     """
-    Place an asset directly into Roblox cache, creating it if it doesn't exist
-    This is useful for assets that may not be in cache yet
+    Back up a cache entry that is about to be replaced, hardlinking when possible
+    
+    The link writes no file data. It is safe because the caller immediately
+    os.replace()s the cache entry with a new file, so the backup ends up as
+    the only name for the original inode. Falls back to shutil.copy2 across
+    volumes or on filesystems without hardlink support.
     
     Args:
+        original_path: Cache entry to back up
+        backup_path: Where to keep the original
+    """
+    try:
+        os.link(original_path, backup_path)
+    except OSError:
+        shutil.copy2(original_path, backup_path)
+
+def copy_into_place(src, dst):
+    """
+    Make dst a copy of src without dst ever being missing or half-written
+    
+    The copy is staged next to dst and moved into place with os.replace.
+    Files are always copied, never hardlinked: Roblox rewrites its cache
+    entries in place, which would also change a linked extracted asset or
+    backup. (Only link_backup links, right before the entry is replaced.)
+    
+    Args:
+        src: File to copy from
+        dst: File to create or replace
+    """
+    tmp_path = dst + '.tmp'
+    try:
+        shutil.copy2(src, tmp_path)
+        os.replace(tmp_path, dst)
+    finally:
+        # Don't leave the staging file in the Roblox cache if anything failed
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+
+def build_cache_index(root):
+    """
+    Build a lowercase filename -> path index of every file under root
+    
+    Scanning once up front lets bulk swaps/restores use dict lookups instead
+    of walking the whole Roblox cache for every asset.
+    
+    Args:
+        root: Directory to index
+    
+    Returns:
+        dict: Lowercased file name mapped to the first path found for it
+    """
+    index = {}
+    for entry in iter_files(root):
+        index.setdefault(entry.name.lower(), entry.path)
+    return index
+
+def place_asset_in_cache_fast(cache_index, asset_hash, replacement_asset_path):
+    """
+    Place an already-resolved replacement asset into Roblox cache using a prebuilt index
+    
+    Args:
+        cache_index: Index of the Roblox cache from build_cache_index
         asset_hash: The hash name to use in the cache
-        replacement_hash: The hash of the replacement asset to copy
+        replacement_asset_path: Path to the replacement asset to copy
     
     Returns:
         dict: Result with success status and message
@@ -305,53 +745,81 @@ def place_asset_in_cache(asset_hash, replacement_hash):
     }
     
     roblox_cache = get_roblox_cache_path()
-    if not os.path.exists(roblox_cache):
-        result["message"] = "Roblox cache directory not found"
-        result["errors"].append(result["message"])
-        return result
-    
-    # Find the replacement asset
-    replacement_asset_path = find_replacement_asset(replacement_hash)
-    if not replacement_asset_path:
-        result["message"] = f"Replacement asset with hash {replacement_hash} not found in extracted assets"
-        result["errors"].append(result["message"])
-        return result
     
     # Always place the replacement asset in cache, regardless of original presence
     destination_path = None
-    original_asset_path = None
-    for root, dirs, files in os.walk(roblox_cache):
-        for file in files:
-            if file == asset_hash or file.lower() == asset_hash.lower():
-                original_asset_path = os.path.join(root, file)
-                break
-        if original_asset_path:
-            break
+    original_asset_path = cache_index.get(asset_hash.lower())
     try:
         if original_asset_path:
             # Asset exists - create backup and replace
             backup_path = original_asset_path + '.cdbl_backup'
+            if os.path.exists(backup_path) and files_identical(replacement_asset_path, original_asset_path):
+                # Already swapped on a previous run - nothing to write
+                result["message"] = f"Asset {asset_hash} already replaced"
+                result["asset_path"] = original_asset_path
+                result["success"] = True
+                return result
             if not os.path.exists(backup_path):
-                shutil.copy2(original_asset_path, backup_path)
-            shutil.copy2(replacement_asset_path, original_asset_path)
+                link_backup(original_asset_path, backup_path)
+            copy_into_place(replacement_asset_path, original_asset_path)
             result["message"] = f"Replaced existing asset {asset_hash}"
+            result["asset_path"] = original_asset_path
         else:
             # Asset doesn't exist - place it directly in cache
             destination_path = os.path.join(roblox_cache, asset_hash)
-            shutil.copy2(replacement_asset_path, destination_path)
+            copy_into_place(replacement_asset_path, destination_path)
             result["message"] = f"Placed new asset {asset_hash} in cache (original missing)"
+            result["asset_path"] = destination_path
         result["success"] = True
     except Exception as e:
         result["message"] = f"Error placing asset: {str(e)}"
         result["errors"].append(result["message"])
     return result
 
-def restore_asset(asset_hash):
+def place_asset_in_cache(asset_hash, replacement_hash, cache_index=None):
+    """
+    Place an asset directly into Roblox cache, creating it if it doesn't exist
+    This is useful for assets that may not be in cache yet
+    
+    Args:
+        asset_hash: The hash name to use in the cache
+        replacement_hash: The hash of the replacement asset to copy
+        cache_index: Optional prebuilt index from build_cache_index (built if None)
+    
+    Returns:
+        dict: Result with success status and message
+    """
+    result = {
+        "success": False,
+        "message": "",
+        "errors": []
+    }
+    
+    roblox_cache = get_roblox_cache_path()
+    if not os.path.exists(roblox_cache):
+        result["message"] = "Roblox cache directory not found"
+        result["errors"].append(result["message"])
+        return result
+    
+    # Find the replacement asset
+    replacement_asset_path = find_replacement_asset(replacement_hash)
+    if not replacement_asset_path:
+        result["message"] = f"Replacement asset with hash {replacement_hash} not found in extracted assets"
+        result["errors"].append(result["message"])
+        return result
+    
+    if cache_index is None:
+        cache_index = build_cache_index(roblox_cache)
+    
+    return place_asset_in_cache_fast(cache_index, asset_hash, replacement_asset_path)
+
+def restore_asset(asset_hash, cache_index=None):
     """
     Restore an asset from backup
     
     Args:
         asset_hash: The hash of the asset to restore
+        cache_index: Optional prebuilt index from build_cache_index, for bulk restores
     
     Returns:
         dict: Result with success status and message
@@ -369,26 +837,27 @@ def restore_asset(asset_hash):
         return result
     
     # Find the asset and its backup
-    for root, dirs, files in os.walk(roblox_cache):
-        for file in files:
-            if file == asset_hash or file.lower() == asset_hash.lower():
-                asset_path = os.path.join(root, file)
-                backup_path = asset_path + '.cdbl_backup'
-                
-                if os.path.exists(backup_path):
-                    try:
-                        shutil.copy2(backup_path, asset_path)
-                        result["success"] = True
-                        result["message"] = f"Successfully restored asset {asset_hash}"
-                        return result
-                    except Exception as e:
-                        result["message"] = f"Error restoring asset: {str(e)}"
-                        result["errors"].append(result["message"])
-                        return result
-                else:
-                    result["message"] = f"No backup found for asset {asset_hash}"
-                    result["errors"].append(result["message"])
-                    return result
+    if cache_index is None:
+        cache_index = build_cache_index(roblox_cache)
+    
+    asset_path = cache_index.get(asset_hash.lower())
+    if asset_path:
+        backup_path = asset_path + '.cdbl_backup'
+        
+        if os.path.exists(backup_path):
+            try:
+                copy_into_place(backup_path, asset_path)
+                result["success"] = True
+                result["message"] = f"Successfully restored asset {asset_hash}"
+                return result
+            except Exception as e:
+                result["message"] = f"Error restoring asset: {str(e)}"
+                result["errors"].append(result["message"])
+                return result
+        else:
+            result["message"] = f"No backup found for asset {asset_hash}"
+            result["errors"].append(result["message"])
+            return result
     
     result["message"] = f"Asset {asset_hash} not found in cache"
     result["errors"].append(result["message"])
@@ -493,6 +962,24 @@ def download_and_prepare_assets():
     
     return result
 
+def get_file_signatures(paths):
+    """Map each path to its [mtime_ns, size], skipping paths that no longer exist"""
+    signatures = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        signatures[path] = [stat.st_mtime_ns, stat.st_size]
+    return signatures
+
+def is_skybox_fix_current(last_applied, assets_hash):
+    """Check whether the last recorded skybox fix used these assets and its files are untouched"""
+    recorded_files = last_applied.get("files")
+    if last_applied.get("assets_hash") != assets_hash or not recorded_files:
+        return False
+    return get_file_signatures(recorded_files) == recorded_files
+
 def apply_skybox_fix():
     """
     Apply skybox fix by swapping assets and applying fastflags
@@ -533,10 +1020,29 @@ def apply_skybox_fix():
             result["errors"].append(result["message"])
             return result
         
+        # Skip the swaps entirely if nothing changed since the last successful run
+        assets_hash = hashlib.sha256(json.dumps(assets_data, sort_keys=True).encode('utf-8')).hexdigest()
+        last_applied_path = os.path.join(cache_dir, '_last_applied.json')
+        last_applied = load_json_file(last_applied_path)
+        if is_skybox_fix_current(last_applied, assets_hash):
+            from .fastflags import apply_fastflags
+            
+            fastflag_result = apply_fastflags(SKYBOX_FIX_FLAGS)
+            if not fastflag_result["success"]:
+                result["message"] = "Failed to apply skybox fix fastflags"
+                result["errors"].extend(fastflag_result["errors"])
+                return result
+            
+            result["success"] = True
+            result["swapped_assets"] = last_applied.get("swapped_assets", [])
+            result["message"] = "Skybox fix already applied"
+            return result
+        
         # Swap each asset defined in assets.json
         # Using place_asset_in_cache which works even if the original doesn't exist
         swapped_count = 0
         failed_count = 0
+        swap_pairs = []
         
         for original_hash, replacement_hash in assets_data.items():
             # Normalize keys/values to strings where possible
@@ -583,7 +1089,33 @@ def apply_skybox_fix():
                 print(f"⚠️ {error_msg}")
                 continue
 
-            swap_result = place_asset_in_cache(orig_hash_str, rep_hash_str)
+            swap_pairs.append((orig_hash_str, rep_hash_str))
+        
+        # Resolve every replacement up front so the workers only touch files
+        swap_plan = []
+        for orig_hash_str, rep_hash_str in swap_pairs:
+            replacement_asset_path = find_replacement_asset(rep_hash_str)
+            if not replacement_asset_path:
+                failed_count += 1
+                error_msg = f"Failed to swap {orig_hash_str}: Replacement asset with hash {rep_hash_str} not found in extracted assets"
+                result["errors"].append(error_msg)
+                print(f"⚠️ {error_msg}")
+                continue
+            swap_plan.append((orig_hash_str, replacement_asset_path))
+        
+        # Index the Roblox cache once instead of walking it for every asset
+        cache_index = build_cache_index(get_roblox_cache_path())
+        
+        # Place assets concurrently - each swap is dominated by file I/O.
+        # Results come back in plan order, so no shared state needs a lock.
+        max_workers = min(16, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            swap_results = list(executor.map(
+                lambda entry: place_asset_in_cache_fast(cache_index, *entry),
+                swap_plan
+            ))
+        
+        for (orig_hash_str, replacement_asset_path), swap_result in zip(swap_plan, swap_results):
             msg = swap_result.get("message", "")
             # Only treat as error if the replacement asset could not be placed at all
             if swap_result["success"]:
@@ -607,12 +1139,7 @@ def apply_skybox_fix():
         # Apply fastflag for skybox fix
         from .fastflags import apply_fastflags
         
-        skybox_fix_flags = {
-            "FFlagRenderSkyboxUseIBL": "False",
-            "FFlagRenderSkyboxUseEnvMap": "False"
-        }
-        
-        fastflag_result = apply_fastflags(skybox_fix_flags)
+        fastflag_result = apply_fastflags(SKYBOX_FIX_FLAGS)
         if not fastflag_result["success"]:
             result["message"] = "Failed to apply skybox fix fastflags"
             result["errors"].extend(fastflag_result["errors"])
@@ -625,6 +1152,14 @@ def apply_skybox_fix():
                 result["message"] = f"Skybox fix applied with {swapped_count} assets swapped ({failed_count} failed)"
             else:
                 result["message"] = f"Skybox fix applied successfully ({swapped_count} assets swapped)"
+                
+                # Remember this run so an unchanged assets.json can skip the swaps next time
+                written_paths = [r["asset_path"] for r in swap_results if r.get("asset_path")]
+                save_json_file(last_applied_path, {
+                    "assets_hash": assets_hash,
+                    "swapped_assets": result["swapped_assets"],
+                    "files": get_file_signatures(written_paths)
+                })
         else:
             result["message"] = "No assets were swapped"
             if failed_count > 0:
@@ -652,12 +1187,12 @@ def get_cache_info():
     }
     
     if os.path.exists(cache_dir):
-        for root, dirs, files in os.walk(cache_dir):
-            info["total_cached_files"] += len(files)
+        info["total_cached_files"] = sum(1 for _ in iter_files(cache_dir))
     
     # Count files in the unified extracted assets directory
     if os.path.exists(extract_dir):
-        for root, dirs, files in os.walk(extract_dir):
-            info["extracted_assets_count"] += len(files)
+        info["extracted_assets_count"] = sum(
+            1 for entry in iter_files(extract_dir) if entry.name != '_extracted_marker.json'
+        )
     
     return info
\ No newline at end of file
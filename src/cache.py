@@ -6,10 +6,11 @@ Provides caching functionality for API calls to reduce flooding and improve perf
 import time
 import json
 import os
+from collections import OrderedDict
 from typing import Optional, Dict, Any, Tuple
 
 class APICache:
-    """Simple in-memory cache with TTL support for API responses"""
+    """Simple in-memory LRU cache with TTL support for API responses"""
     
     def __init__(self, default_ttl: int = 300):  # 5 minutes default
         """
@@ -18,7 +19,7 @@ class APICache:
         Args:
             default_ttl: Default time-to-live in seconds
         """
-        self._cache: Dict[str, Tuple[Any, float]] = {}
+        self._cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()  # key -> (value, expires_at)
         self._default_ttl = default_ttl
         self._max_size = 100  # Prevent memory bloat
         
@@ -32,16 +33,19 @@ class APICache:
         Returns:
             Cached value or None if not found/expired
         """
-        if key not in self._cache:
+        entry = self._cache.get(key)
+        if entry is None:
             return None
             
-        value, timestamp = self._cache[key]
+        value, expires_at = entry
         
         # Check if expired
-        if time.time() - timestamp > self._default_ttl:
+        if time.time() > expires_at:
             del self._cache[key]
             return None
-            
+        
+        # Mark as most recently used
+        self._cache.move_to_end(key)
         return value
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
@@ -54,25 +58,23 @@ class APICache:
             ttl: Time-to-live in seconds (uses default if None)
         """
         # Clean up expired entries if cache is getting large
-        if len(self._cache) >= self._max_size:
+        if len(self._cache) >= self._max_size and key not in self._cache:
             self._cleanup_expired()
-            
-        # If still too large, remove oldest entries
-        if len(self._cache) >= self._max_size:
-            oldest_keys = sorted(self._cache.keys(), 
-                               key=lambda k: self._cache[k][1])[:10]
-            for old_key in oldest_keys:
-                del self._cache[old_key]
         
         cache_ttl = ttl if ttl is not None else self._default_ttl
-        self._cache[key] = (value, time.time())
+        self._cache[key] = (value, time.time() + cache_ttl)
+        self._cache.move_to_end(key)
+        
+        # If still too large, evict the least recently used entries
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
     
     def _cleanup_expired(self) -> None:
         """Remove expired entries from cache"""
         current_time = time.time()
         expired_keys = [
-            key for key, (_, timestamp) in self._cache.items()
-            if current_time - timestamp > self._default_ttl
+            key for key, (_, expires_at) in self._cache.items()
+            if current_time > expires_at
         ]
         for key in expired_keys:
             del self._cache[key]
@@ -4,21 +4,33 @@ Contains all the main functionality for CDBL operations
 """
 
 import os
-import requests
-import zipfile
 import shutil
 import sys
-import subprocess
-import platform
-import time
-import xml.etree.ElementTree as ET
-import json
-import webbrowser
-from tqdm import tqdm
+import io
+import logging
+import tempfile
+import threading
+from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from src.jsonio import encode_json, decode_json
+
+# requests, tqdm and zipfile are imported inside the functions that use them,
+# so importing this module for paths/version helpers stays cheap
+
+logger = logging.getLogger(__name__)
 
 # SSL certificate handling for PyInstaller EXE
+@lru_cache(maxsize=1)
 def get_ssl_context():
-    """Get SSL certificate bundle path for requests"""
+    """Get SSL certificate bundle path for requests (None if no bundle exists on disk)"""
+    cert_bundle = find_ssl_bundle()
+    if cert_bundle and os.path.exists(cert_bundle):
+        return cert_bundle
+    return None
+
+def find_ssl_bundle():
+    """Locate the SSL certificate bundle for the current way CDBL is running"""
     if getattr(sys, 'frozen', False):
         # Running as PyInstaller EXE
         try:
@@ -44,45 +56,75 @@ def get_ssl_context():
 # Configure requests session with SSL certificates
 def get_requests_session():
     """Get a configured requests session with proper SSL handling"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
     session = requests.Session()
     
     # Set SSL certificate bundle
     cert_bundle = get_ssl_context()
-    if cert_bundle and os.path.exists(cert_bundle):
+    if cert_bundle:
         session.verify = cert_bundle
-        print(f"Using SSL certificates: {cert_bundle}")
+        logger.debug("Using SSL certificates: %s", cert_bundle)
     else:
         print("Warning: SSL certificates not found, using system default")
     
     # Set reasonable timeouts
     session.timeout = (10, 30)  # (connect_timeout, read_timeout)
     
-    # Set user agent
+    # Pool enough connections for parallel downloads and retry transient failures
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD'])
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    
+    # Set user agent. The payloads (zip/ogg/png) are already compressed, so ask
+    # for them as-is - no wasted gzip pass and Content-Length stays accurate
     session.headers.update({
-        'User-Agent': 'CDBL/2.0 (Windows; requests)'
+        'User-Agent': 'CDBL/2.0 (Windows; requests)',
+        'Accept-Encoding': 'identity'
     })
     
     return session
 
-# Global session for reuse
+# Global session for reuse; the lock stops parallel download workers from
+# each building their own session on first use
 _session = None
+_session_lock = threading.Lock()
 
 def get_session():
     """Get or create the global requests session"""
     global _session
     if _session is None:
-        _session = get_requests_session()
+        with _session_lock:
+            if _session is None:
+                _session = get_requests_session()
     return _session
 
 # ========== Set Paths for Roblox, Bloxstrap, and Fishstrap ==========
 
-roblox_path = os.path.join(os.environ['LOCALAPPDATA'], 'Roblox')
-bloxstrap_path = os.path.join(os.environ['LOCALAPPDATA'], 'Bloxstrap')
-fishstrap_path = os.path.join(os.environ['LOCALAPPDATA'], 'Fishstrap')
+local_appdata_path = os.environ['LOCALAPPDATA']
+
+roblox_path = os.path.join(local_appdata_path, 'Roblox')
+bloxstrap_path = os.path.join(local_appdata_path, 'Bloxstrap')
+fishstrap_path = os.path.join(local_appdata_path, 'Fishstrap')
+
+# Versions folder per client, keyed by lowercased client name
+versions_paths = {
+    "roblox": os.path.join(roblox_path, 'Versions'),
+    "bloxstrap": os.path.join(bloxstrap_path, 'Versions'),
+    "fishstrap": os.path.join(fishstrap_path, 'Versions')
+}
 
 # ========== Set Paths for CDBL ==========
 
-cdbllite_path = os.path.join(os.environ['LOCALAPPDATA'], 'CDBL')
+cdbllite_path = os.path.join(local_appdata_path, 'CDBL')
 cdbl_temp_path = os.path.join(cdbllite_path, 'Temp')
 cdbl_skybox_data_path = os.path.join(cdbllite_path, 'SkyboxData')
 cdbl_skybox_pngs_path = os.path.join(cdbl_skybox_data_path, 'SkyPNGs')
@@ -113,16 +155,12 @@ paths = [
 
 def ensure_directories():
     """Ensure all CDBL directories exist"""
+    # makedirs(exist_ok=True) already tolerates existing folders - no need to stat first
     for path in paths:
-        if not os.path.exists(path):
-            os.makedirs(path, exist_ok=True)
-            print(f"Created directory: {os.path.basename(path)}")
-        else:
-            print(f"Directory already exists: {os.path.basename(path)}")
+        os.makedirs(path, exist_ok=True)
 
 # Initialize directories on module import
-for path in paths:
-    os.makedirs(path, exist_ok=True)
+ensure_directories()
     
 # ========== File URLs ==========
 
@@ -172,14 +210,82 @@ GITHUB_RELEASES_API = f"https://api.github.com/repos/{GITHUB_USERNAME}/{GITHUB_R
 
 # ========== File Functions ==========
 
-def download_file(url, destination):
-    """Download a file from a URL to a specified destination."""
+# Streaming read size - large enough to keep write calls and progress updates cheap
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Archives up to this size are extracted straight from memory
+IN_MEMORY_ZIP_LIMIT = 100 * 1024 * 1024
+# Larger (or unknown-size) archives spill to a temp file past this size
+SPOOLED_ZIP_MAX_SIZE = 64 * 1024 * 1024
+
+# ETags of downloaded artifacts, so unchanged files can be revalidated with a 304
+download_manifest_path = os.path.join(cdbllite_path, 'download_manifest.json')
+
+def load_download_manifest():
+    """Load the url -> {"etag", "installed_at"} download manifest (empty if missing or invalid)."""
+    try:
+        with open(download_manifest_path, 'rb') as f:
+            manifest = decode_json(f.read())
+        return manifest if isinstance(manifest, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_download_manifest(manifest):
+    """Save the url -> {"etag", "installed_at"} download manifest."""
+    tmp_path = download_manifest_path + '.tmp'
+    try:
+        # Swap in a complete file, so an interrupted save can't leave a truncated manifest
+        with open(tmp_path, 'wb') as f:
+            f.write(encode_json(manifest))
+        os.replace(tmp_path, download_manifest_path)
+    except (OSError, TypeError) as e:
+        print(f"Could not save download manifest: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def get_conditional_headers(url, manifest):
+    """Build If-None-Match headers for url from the manifest, if it has an ETag."""
+    entry = manifest.get(url) if manifest is not None else None
+    etag = entry.get('etag') if isinstance(entry, dict) else None
+    return {'If-None-Match': etag} if etag else {}
+
+def record_download(manifest, url, response):
+    """Record a successful download (and its ETag, if any) in the manifest."""
+    if manifest is not None:
+        manifest[url] = {
+            'etag': response.headers.get('ETag'),
+            'installed_at': datetime.now().isoformat()
+        }
+
+def download_file(url, destination, manifest=None):
+    """Download a file from a URL to a specified destination.
+    If a manifest is given, an unchanged file (HTTP 304) is skipped and the new ETag is recorded."""
+    import requests
+    
     try:
         session = get_session()
-        response = session.get(url, timeout=30)
-        response.raise_for_status()  # Raise an error for bad responses
-        with open(destination, 'wb') as file:
-            file.write(response.content)
+        with session.get(url, stream=True, timeout=30, headers=get_conditional_headers(url, manifest)) as response:
+            if response.status_code == 304:
+                print(f"{os.path.basename(url)} is up to date")
+                return True
+            response.raise_for_status()  # Raise an error for bad responses
+            
+            # No progress to report, so let copyfileobj stream the raw body in C.
+            # Write beside the destination and swap it in, so an interrupted
+            # download never leaves a truncated file behind.
+            response.raw.decode_content = True
+            tmp_path = destination + '.tmp'
+            try:
+                with open(tmp_path, 'wb') as file:
+                    shutil.copyfileobj(response.raw, file, length=1024 * 1024)
+                os.replace(tmp_path, destination)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            record_download(manifest, url, response)
         print(f"Downloaded {os.path.basename(url)}")
         return True
     except requests.RequestException as e:
@@ -191,16 +297,16 @@ def download_file(url, destination):
 
 def download_file_with_progress(url, destination, progress_callback=None):
     """Download a file from a URL to a specified destination with a progress bar."""
+    import requests
+    from tqdm import tqdm
+    
     try:
         session = get_session()
         
-        # Make a HEAD request to get the file size
-        head_response = session.head(url, allow_redirects=True, timeout=10)
-        total_size = int(head_response.headers.get('content-length', 0))
-        
-        # Start the download with streaming
+        # Start the download with streaming - the GET's headers carry the file size
         response = session.get(url, stream=True, timeout=30)
         response.raise_for_status()
+        total_size = int(response.headers.get('content-length', 0))
         
         filename = os.path.basename(url)
         downloaded = 0
@@ -212,11 +318,21 @@ def download_file_with_progress(url, destination, progress_callback=None):
                 unit='iB',
                 unit_scale=True,
                 desc=f"Downloading {filename}",
-                ncols=80
+                ncols=80,
+                dynamic_ncols=False,
+                miniters=1,
+                mininterval=0.25,
+                maxinterval=1.0,
+                smoothing=0.05
             )
         
         with open(destination, 'wb') as file:
-            for chunk in response.iter_content(chunk_size=8192):
+            # Reserve the full size up front so the file is laid out in one go
+            if total_size > 0:
+                file.truncate(total_size)
+                file.seek(0)
+            
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 if chunk:
                     file.write(chunk)
                     downloaded += len(chunk)
@@ -228,6 +344,9 @@ def download_file_with_progress(url, destination, progress_callback=None):
                         if total_size > 0:
                             percentage = int((downloaded / total_size) * 100)
                             progress_callback(percentage, f"Downloading {filename}")
+            
+            # Drop any reserved space the body didn't fill
+            file.truncate()
         
         if progress_callback is None:
             progress_bar.close()
@@ -242,11 +361,114 @@ def download_file_with_progress(url, destination, progress_callback=None):
         print(f"❌ Error during download: {e}")
         return False
         
+@lru_cache(maxsize=1)
+def get_isal_zlib():
+    """Get isal's isal_zlib (a zlib replacement with SIMD-accelerated inflate), or None if not installed"""
+    try:
+        from isal import isal_zlib
+        return isal_zlib
+    except ImportError:
+        return None
+
+def get_member_target(extract_to, member_name):
+    """Path a zip member extracts to, or None if it would land outside extract_to"""
+    target = os.path.normpath(os.path.join(extract_to, member_name))
+    if not target.startswith(os.path.join(os.path.normpath(extract_to), '')):
+        return None
+    return target
+
+def read_deflated_member(zip_file, member, isal_zlib):
+    """
+    Inflate one deflate-compressed zip member with isal, checking its CRC
+    
+    Args:
+        zip_file: The zip opened in binary mode
+        member: ZipInfo of a ZIP_DEFLATED, unencrypted member
+        isal_zlib: The isal_zlib module
+    
+    Returns:
+        bytes: The member's uncompressed contents
+    """
+    import struct
+    import zipfile
+    
+    # The data starts after the local header's fixed 30 bytes, name and extra field
+    zip_file.seek(member.header_offset)
+    header = zip_file.read(30)
+    if header[:4] != b'PK\x03\x04':
+        raise zipfile.BadZipFile(f"Bad local header for {member.filename}")
+    name_length, extra_length = struct.unpack('<HH', header[26:30])
+    zip_file.seek(member.header_offset + 30 + name_length + extra_length)
+    
+    data = isal_zlib.decompress(zip_file.read(member.compress_size), -15)
+    if isal_zlib.crc32(data) != member.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for {member.filename}")
+    return data
+
+def extract_zip_members(zip_ref, zip_file, members, extract_to):
+    """
+    Extract members of an open zip, inflating deflated ones with isal when it is installed
+    
+    Args:
+        zip_ref: ZipFile opened on zip_file, used for members isal can't handle
+        zip_file: The zip's binary file object, read directly for isal members
+        members: ZipInfo entries to extract
+        extract_to: Directory to extract into (members outside it are skipped)
+    """
+    import zipfile
+    isal_zlib = get_isal_zlib()
+    
+    for member in members:
+        target = get_member_target(extract_to, member.filename)
+        if target is None:
+            continue
+        
+        use_isal = (
+            isal_zlib is not None
+            and not member.is_dir()
+            and member.compress_type == zipfile.ZIP_DEFLATED
+            and not member.flag_bits & 0x1  # encrypted
+        )
+        if not use_isal:
+            zip_ref.extract(member, extract_to)
+            continue
+        
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'wb') as f:
+            f.write(read_deflated_member(zip_file, member, isal_zlib))
+
+def extract_members(zip_path, members, extract_to):
+    """Extract the given members using a ZipFile handle of this worker's own."""
+    import zipfile
+    
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref, open(zip_path, 'rb') as zip_file:
+        extract_zip_members(zip_ref, zip_file, members, extract_to)
+
 def unzip_file(zip_path, extract_to):
-    """Unzip a file to a specified directory."""
+    """Unzip a file to a specified directory, spreading the members over worker threads."""
+    import zipfile
+    
     try:
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_to)
+            members = zip_ref.infolist()
+        
+        # zlib and file writes release the GIL, so archives with many members
+        # (like the SkyPNGs parts) extract in parallel
+        workers = min(8, os.cpu_count() or 1, max(1, len(members) // 16))
+        if workers <= 1:
+            extract_members(zip_path, members, extract_to)
+        else:
+            # Create the folders up front so workers never race on makedirs,
+            # skipping members that would land outside extract_to (e.g. "../")
+            targets = (get_member_target(extract_to, m.filename) for m in members)
+            for folder in {os.path.dirname(target) for target in targets if target is not None}:
+                os.makedirs(folder, exist_ok=True)
+            
+            # ZipFile handles aren't safe to share between threads - each worker opens its own
+            batches = [members[i::workers] for i in range(workers)]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda batch: extract_members(zip_path, batch, extract_to), batches))
+        
         print(f"Extracted {os.path.basename(zip_path)}")
         return True
     except zipfile.BadZipFile as e:
@@ -264,13 +486,48 @@ def delete_file(file_path):
     else:
         print(f"{file_path} does not exist, skipping deletion.")
         
-def download_and_extract(url, destination):
-    """Download a file and extract it if it's a zip file. 
-    If files are in a subfolder, move them up to the destination and remove the subfolder."""
-    zip_path = os.path.join(destination, os.path.basename(url))
-    download_file(url, zip_path)
-    unzip_file(zip_path, destination)
-    delete_file(zip_path)  # Clean up the zip file after extraction
+def download_and_extract(url, destination, manifest=None):
+    """Download a zip file and extract it into destination without saving the zip to disk.
+    If a manifest is given, an unchanged archive (HTTP 304) is not re-extracted and the new ETag is recorded."""
+    import requests
+    import zipfile
+    
+    filename = os.path.basename(url)
+    try:
+        session = get_session()
+        with session.get(url, stream=True, timeout=30, headers=get_conditional_headers(url, manifest)) as response:
+            if response.status_code == 304:
+                print(f"{filename} is up to date")
+                return True
+            response.raise_for_status()
+            response.raw.decode_content = True
+            
+            # Small archives stay in memory; big or unknown-size ones may spill to disk
+            total_size = int(response.headers.get('content-length', 0))
+            if 0 < total_size <= IN_MEMORY_ZIP_LIMIT:
+                buffer = io.BytesIO()
+            else:
+                buffer = tempfile.SpooledTemporaryFile(max_size=SPOOLED_ZIP_MAX_SIZE)
+            
+            with buffer:
+                shutil.copyfileobj(response.raw, buffer, length=DOWNLOAD_CHUNK_SIZE)
+                buffer.seek(0)
+                with zipfile.ZipFile(buffer) as zip_ref:
+                    extract_zip_members(zip_ref, buffer, zip_ref.infolist(), destination)
+            
+            record_download(manifest, url, response)
+        
+        print(f"Downloaded and extracted {filename}")
+        return True
+    except requests.RequestException as e:
+        print(f"Failed to download {url}: {e}")
+        return False
+    except zipfile.BadZipFile as e:
+        print(f"Failed to unzip {filename}: {e}")
+        return False
+    except Exception as e:
+        print(f"Error extracting {filename}: {e}")
+        return False
 
 def download_and_extract_with_progress(url, destination, progress_callback=None):
     """Download a file with progress bar and extract it if it's a zip file. 
@@ -297,111 +554,166 @@ def download_and_extract_with_progress(url, destination, progress_callback=None)
 def download_needed_files():
     """Download and extract all necessary files for CDBL-Lite, only if they don't already exist."""
 
+    # Lowercased entry names per directory - each directory is only enumerated once
+    scanned = {}
+    
+    def scan(directory):
+        if directory not in scanned:
+            try:
+                with os.scandir(directory) as entries:
+                    scanned[directory] = frozenset(entry.name.lower() for entry in entries)
+            except OSError:
+                print(f"Directory {directory} not found")
+                scanned[directory] = frozenset()
+        return scanned[directory]
+
     # Helper to check if a file exists in a directory
     def file_exists_in_dir(filename, directory):
-        return os.path.exists(os.path.join(directory, filename))
+        return filename.lower() in scan(directory)
     
     # Helper to check if directory has files with specific extensions
     def has_files_with_extensions(directory, extensions):
-        try:
-            files = os.listdir(directory)
-            matching_files = [f for f in files if any(f.lower().endswith(ext.lower()) for ext in extensions)]
-            if matching_files:
-                print(f"Found {len(matching_files)} files in {os.path.basename(directory)}")
-            return len(matching_files) > 0
-        except FileNotFoundError:
-            print(f"Directory {directory} not found")
-            return False
+        extensions = tuple(ext.lower() for ext in extensions)
+        matching_files = [name for name in scan(directory) if name.endswith(extensions)]
+        if matching_files:
+            print(f"Found {len(matching_files)} files in {os.path.basename(directory)}")
+        return len(matching_files) > 0
+
+    # Artifacts installed on earlier runs. These are revalidated with a conditional
+    # GET instead of being fetched again, as long as their files are still on disk
+    manifest = load_download_manifest()
+
+    # Build the steps for one artifact: download it if it's missing on disk,
+    # otherwise revalidate it if the manifest knows it
+    def plan(kind, url, destination, exists, label):
+        if not exists():
+            # Deleted or never installed - drop the validators so the server
+            # sends the file instead of a 304
+            manifest.pop(url, None)
+            print(f"{label}...")
+            return [(kind, url, destination)]
+        if url in manifest:
+            print(f"{label} installed, checking for updates")
+            return [(kind, url, destination)]
+        print(f"{label} already exists, skipping download")
+        return []
+
+    # Each job is a list of (kind, url, destination) steps run in order.
+    # Archives that extract into the same folder share a job so their
+    # extractions never race on creating the same subdirectories.
+    jobs = []
 
     print("🔍 Checking existing files...")
     
     # Skybox PNGs - check if we already have PNG files
-    if not has_files_with_extensions(cdbl_skybox_pngs_path, ['.png']):
-        print("SkyPNGs part 1...")
-        download_and_extract(skybox_pngs_zip1, cdbl_skybox_pngs_path)
-        print("SkyPNGs part 2...")
-        download_and_extract(skybox_pngs_zip2, cdbl_skybox_pngs_path)
-    else:
-        print("SkyPNGs already exist, skipping download")
-    
-    # Sky-list.txt
-    if not file_exists_in_dir('Sky-list.txt', cdbl_skybox_data_path):
-        print("Sky-list.txt...")
-        download_file(skys_list, os.path.join(cdbl_skybox_data_path, 'Sky-list.txt'))
-    else:
-        print("Sky-list.txt already exists, skipping download")
+    pngs_exist = lambda: has_files_with_extensions(cdbl_skybox_pngs_path, ['.png'])
+    jobs.append(
+        plan('zip', skybox_pngs_zip1, cdbl_skybox_pngs_path, pngs_exist, "SkyPNGs part 1") +
+        plan('zip', skybox_pngs_zip2, cdbl_skybox_pngs_path, pngs_exist, "SkyPNGs part 2")
+    )
     
     # SkyboxPatch.zip
-    try:
-        patch_files = os.listdir(cdbl_skybox_patch_path)
-        if not patch_files:
-            print("SkyboxPatch...")
-            download_and_extract(skybox_patch, cdbl_skybox_patch_path)
-        else:
-            print("SkyboxPatch already exists, skipping download")
-    except OSError:
-        print("SkyboxPatch...")
-        download_and_extract(skybox_patch, cdbl_skybox_patch_path)
+    patch_exists = lambda: bool(scan(cdbl_skybox_patch_path))
+    jobs.append(plan('zip', skybox_patch, cdbl_skybox_patch_path, patch_exists, "SkyboxPatch"))
     
-    # DefaultSky.zip - check for specific sky files
-    if not has_files_with_extensions(cdbl_skybox_data_path, ['.sky', '.rbxm']):
-        print("DefaultSky...")
-        download_and_extract(default_sky, cdbl_skybox_data_path)
-    else:
-        print("DefaultSky files already exist, skipping download")
+    # Sky-list.txt and DefaultSky.zip (check for specific sky files) both land in SkyboxData
+    jobs.append(
+        plan('file', skys_list, os.path.join(cdbl_skybox_data_path, 'Sky-list.txt'),
+             lambda: file_exists_in_dir('Sky-list.txt', cdbl_skybox_data_path), "Sky-list.txt") +
+        plan('zip', default_sky, cdbl_skybox_data_path,
+             lambda: has_files_with_extensions(cdbl_skybox_data_path, ['.sky', '.rbxm']), "DefaultSky")
+    )
 
     # Texture files - check if we already have texture files
-    texture_files_exist = (
+    texture_files_exist = lambda: (
         has_files_with_extensions(cdbl_texture_data_path, ['.zip']) or
-        any(os.path.exists(os.path.join(cdbl_texture_data_path, folder)) 
+        any(folder.lower() in scan(cdbl_texture_data_path)
             for folder in ['DarkTextures', 'DefaultTexturesWSky', 'LightTextures'])
     )
-    
-    if not texture_files_exist:
-        print("Downloading texture files...")
-        download_and_extract(dark_textures, cdbl_texture_data_path)
-        download_and_extract(light_textures, cdbl_texture_data_path)
-        download_and_extract(default_textures, cdbl_texture_data_path)
-    else:
-        print("Texture files already exist, skipping download")
+    jobs.append(
+        plan('zip', dark_textures, cdbl_texture_data_path, texture_files_exist, "DarkTextures") +
+        plan('zip', light_textures, cdbl_texture_data_path, texture_files_exist, "LightTextures") +
+        plan('zip', default_textures, cdbl_texture_data_path, texture_files_exist, "DefaultTexturesWSky")
+    )
     
     # Sound files
-    if not file_exists_in_dir('og-oof.ogg', cdbl_sound_data_path):
-        print("og-oof.ogg...")
-        download_file(og_oof, os.path.join(cdbl_sound_data_path, 'og-oof.ogg'))
-    else:
-        print("og-oof.ogg already exists, skipping download")
-        
-    if not file_exists_in_dir('DefaultOOF.ogg', cdbl_sound_data_path):
-        print("DefaultOOF.ogg...")
-        download_file(default_oof, os.path.join(cdbl_sound_data_path, 'DefaultOOF.ogg'))
-    else:
-        print("DefaultOOF.ogg already exists, skipping download")
+    for filename, url in (('og-oof.ogg', og_oof), ('DefaultOOF.ogg', default_oof)):
+        jobs.append(plan('file', url, os.path.join(cdbl_sound_data_path, filename),
+                         lambda: file_exists_in_dir(filename, cdbl_sound_data_path), filename))
 
     # RBX Settings XML file
-    if not file_exists_in_dir('GlobalBasicSettings_13.xml', cdbl_other_data_path):
-        print("GlobalBasicSettings_13.xml...")
-        download_file(rbx_settings_xml, os.path.join(cdbl_other_data_path, 'GlobalBasicSettings_13.xml'))
-    else:
-        print("GlobalBasicSettings_13.xml already exists, skipping download")
+    jobs.append(plan('file', rbx_settings_xml, os.path.join(cdbl_other_data_path, 'GlobalBasicSettings_13.xml'),
+                     lambda: file_exists_in_dir('GlobalBasicSettings_13.xml', cdbl_other_data_path),
+                     "GlobalBasicSettings_13.xml"))
+    
+    # Revalidate every known artifact at once with parallel conditional HEADs -
+    # one round trip for all of them instead of one per step inside the serial jobs
+    def is_current(url):
+        headers = get_conditional_headers(url, manifest)
+        if not headers:
+            return False
+        try:
+            response = get_session().head(url, headers=headers, allow_redirects=True, timeout=5)
+            return response.status_code == 304
+        except Exception:
+            return False  # let the conditional GET sort it out
+
+    known_urls = [url for job in jobs for _, url, _ in job if url in manifest]
+    if known_urls:
+        with ThreadPoolExecutor(max_workers=min(10, len(known_urls))) as executor:
+            current_urls = {url for url, current in zip(known_urls, executor.map(is_current, known_urls)) if current}
+        for url in current_urls:
+            print(f"{os.path.basename(url)} is up to date")
+        jobs = [[step for step in job if step[1] not in current_urls] for job in jobs]
+    
+    jobs = [job for job in jobs if job]
+
+    # Run a job's steps in order
+    def run_job(job):
+        for kind, url, destination in job:
+            if kind == 'zip':
+                download_and_extract(url, destination, manifest)
+            else:
+                download_file(url, destination, manifest)
+
+    # Downloads are network bound, so fetch the independent jobs concurrently.
+    # Each step only writes its own URL's entry in the manifest.
+    if jobs:
+        with ThreadPoolExecutor(max_workers=min(6, len(jobs))) as executor:
+            list(executor.map(run_job, jobs))
+        save_download_manifest(manifest)
 
 # ========== Utility Functions ==========
 
+sky_list_path = os.path.join(cdbl_skybox_data_path, 'Sky-list.txt')
+
+@lru_cache(maxsize=1)
+def load_sky_list(mtime_ns):
+    """Read and parse Sky-list.txt. Cached per file version (mtime_ns)."""
+    with open(sky_list_path, 'r', encoding='utf-8') as f:
+        return tuple(line.strip() for line in f if line.strip())
+
+def get_sky_list():
+    """Get the sky names from Sky-list.txt, or None if the file doesn't exist.
+    The file is only re-read when it changes (e.g. after an update download)."""
+    try:
+        mtime_ns = os.stat(sky_list_path).st_mtime_ns
+    except OSError:
+        return None
+    return load_sky_list(mtime_ns)
+
 def get_versions_path(target_client_name):
     """Get the versions path for the specified client."""
-    client_name = target_client_name.lower()
-    if client_name == "roblox":
-        return os.path.join(os.environ['LOCALAPPDATA'], 'Roblox', 'Versions')
-    elif client_name == "bloxstrap":
-        return os.path.join(os.environ['LOCALAPPDATA'], 'Bloxstrap', 'Versions')
-    elif client_name == "fishstrap":
-        return os.path.join(os.environ['LOCALAPPDATA'], 'Fishstrap', 'Versions')
-    else:
-        return None
+    return versions_paths.get(target_client_name.lower())
     
 def get_all_version_folders(target_client_name):
     """Get a list of all version folders for the specified client."""
     versions_path = get_versions_path(target_client_name)
-    if not versions_path or not os.path.exists(versions_path):
+    if not versions_path:
         return []
-    return [d for d in os.listdir(versions_path) if os.path.isdir(os.path.join(versions_path, d))]
\ No newline at end of file
+    # scandir entries already know whether they are folders - no stat per entry
+    try:
+        with os.scandir(versions_path) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
+    except OSError:
+        return []
\ No newline at end of file
@@ -4,35 +4,115 @@ Contains all fast flag functionality for Roblox IxpSettings.json
 """
 
 import os
-import json
+import copy
 import stat
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 
+from src.jsonio import encode_json, decode_json
+
+# Parsed JSON (and the raw bytes it came from) kept in memory, reloaded only
+# when the file's mtime changes
+_tracking_cache = {"mtime": None, "data": None, "raw": None, "checked_at": 0.0}
+_ixp_cache = {"mtime": None, "data": None, "raw": None, "checked_at": 0.0}
+
+# Status checks trust a tracking cache verified this recently without re-statting
+TRACKING_CHECK_TTL = 0.05
+
+# FastFlag used by the skybox and no arms fixes (Roblox expects the string "false")
+SKYBOX_FLAG_NAME = "FFlagHttpUseRbxStorage10"
+SKYBOX_FLAG_VALUE = "false"
+FLEASION_FLAG = MappingProxyType({SKYBOX_FLAG_NAME: SKYBOX_FLAG_VALUE})
+
+# Per-thread state for writable_ixp() windows
+_ixp_writable = threading.local()
+
+@lru_cache(maxsize=1)
 def get_roblox_settings_path():
     """Get the path to Roblox ClientSettings directory"""
     appdata = os.getenv('LOCALAPPDATA')
     return os.path.join(appdata, 'Roblox', 'ClientSettings')
 
+@lru_cache(maxsize=1)
 def get_ixp_settings_path():
     """Get the path to IxpSettings.json"""
     return os.path.join(get_roblox_settings_path(), 'IxpSettings.json')
 
+@lru_cache(maxsize=1)
 def get_cdbl_tracking_path():
-    """Get the path to CDBL tracking file"""
+    """Get the path to CDBL tracking file (the CDBL folder is created on first call)"""
     appdata = os.getenv('LOCALAPPDATA')
     cdbl_dir = os.path.join(appdata, 'CDBL')
     os.makedirs(cdbl_dir, exist_ok=True)
     return os.path.join(cdbl_dir, 'fastflags_tracking.json')
 
-def load_tracking_data():
-    """Load CDBL fastflags tracking data"""
-    tracking_path = get_cdbl_tracking_path()
-    if os.path.exists(tracking_path):
+def cached_json_data(file_path, cache):
+    """
+    Get the parsed content of a JSON file, reusing the cached parse while the file is unchanged
+    
+    Args:
+        file_path: Path of the JSON file
+        cache: Cache dict with "mtime" and "data" keys
+    
+    Returns:
+        The cached data (shared - do not mutate), or None if missing/unreadable
+    """
+    try:
+        mtime = os.stat(file_path).st_mtime_ns
+    except OSError:
+        invalidate_json_cache(cache)
+        return None
+    
+    if cache["mtime"] != mtime:
         try:
-            with open(tracking_path, 'r') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            data = decode_json(raw)
         except Exception:
-            pass
+            invalidate_json_cache(cache)
+            return None
+        cache["mtime"] = mtime
+        cache["data"] = data
+        cache["raw"] = raw
+    
+    cache["checked_at"] = time.monotonic()
+    return cache["data"]
+
+def invalidate_json_cache(cache):
+    """Forget a cached parse so the next load re-reads the file"""
+    cache["mtime"] = None
+    cache["data"] = None
+    cache["raw"] = None
+    cache["checked_at"] = 0.0
+
+def invalidate_tracking_cache():
+    """Forget the cached tracking data (e.g. after the file was edited externally)"""
+    invalidate_json_cache(_tracking_cache)
+
+def load_cached_json(file_path, cache):
+    """Load a JSON file through the cache, returning a private copy (or None)"""
+    # Callers mutate what they get back, so never hand out the cached object
+    return copy.deepcopy(cached_json_data(file_path, cache))
+
+def remember_json(file_path, cache, data, raw):
+    """Record freshly written data in the cache so the next load skips parsing"""
+    try:
+        cache["mtime"] = os.stat(file_path).st_mtime_ns
+        cache["data"] = copy.deepcopy(data)
+        cache["raw"] = raw
+        cache["checked_at"] = time.monotonic()
+    except OSError:
+        invalidate_json_cache(cache)
+
+def load_tracking_data():
+    """Load CDBL fastflags tracking data"""
+    tracking_data = load_cached_json(get_cdbl_tracking_path(), _tracking_cache)
+    if tracking_data is not None:
+        return tracking_data
     return {
         "applied_flags": {},
         "last_modified": None,
@@ -42,71 +122,197 @@ def load_tracking_data():
 def save_tracking_data(tracking_data):
     """Save CDBL fastflags tracking data"""
     tracking_path = get_cdbl_tracking_path()
-    tracking_data["last_modified"] = datetime.now().isoformat()
+    
+    # Skip the write if nothing but the timestamp would change
+    current = cached_json_data(tracking_path, _tracking_cache)
+    if isinstance(current, dict) and "last_modified" in current:
+        if {**tracking_data, "last_modified": current["last_modified"]} == current:
+            tracking_data["last_modified"] = current["last_modified"]
+            return True
+    
+    # Stored as epoch nanoseconds; get_applied_fastflags formats it for display
+    tracking_data["last_modified"] = time.time_ns()
+    tmp_path = tracking_path + ".tmp"
     try:
-        with open(tracking_path, 'w') as f:
-            json.dump(tracking_data, f, indent=4)
+        payload = encode_json(tracking_data)
+        # Write next to the target and swap it in, so readers never see a half-written file
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, tracking_path)
+        remember_json(tracking_path, _tracking_cache, tracking_data, payload)
         return True
     except Exception:
+        invalidate_tracking_cache()
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         return False
 
+@contextmanager
+def tracking_transaction():
+    """
+    Load tracking data once and save it once when the block finishes
+    
+    Yields:
+        dict: "data" is the tracking data to modify in place. Set "commit" to
+        False to skip the save; "saved" holds the save result afterwards.
+    """
+    transaction = {"data": load_tracking_data(), "commit": True, "saved": False}
+    yield transaction
+    if transaction["commit"]:
+        transaction["saved"] = save_tracking_data(transaction["data"])
+
+def peek_tracking_data():
+    """
+    Get tracking data for read-only status checks
+    
+    Skips even the stat call when the cache was verified within TRACKING_CHECK_TTL,
+    and returns the shared cached dict, so callers must not modify it.
+    """
+    if _tracking_cache["data"] is not None and time.monotonic() - _tracking_cache["checked_at"] < TRACKING_CHECK_TTL:
+        return _tracking_cache["data"]
+    return cached_json_data(get_cdbl_tracking_path(), _tracking_cache) or {}
+
 def load_ixp_settings():
     """Load current IxpSettings.json content"""
-    ixp_path = get_ixp_settings_path()
-    if os.path.exists(ixp_path):
-        try:
-            with open(ixp_path, 'r') as f:
-                return json.load(f)
-        except Exception:
-            pass
+    settings = load_cached_json(get_ixp_settings_path(), _ixp_cache)
+    if settings is not None:
+        return settings
     return {}
 
 def set_file_readonly(file_path):
     """Set a file to readonly mode"""
     try:
-        if os.path.exists(file_path):
-            # Make file readonly
+        # One stat answers both "does it exist" and "is it already readonly"
+        # (a missing file raises FileNotFoundError)
+        mode = os.stat(file_path).st_mode
+        # Make file readonly (skip the chmod if it already is)
+        if mode & stat.S_IWRITE:
             os.chmod(file_path, stat.S_IREAD)
-            return True
+        return True
     except Exception:
-        pass
-    return False
+        return False
 
 def remove_file_readonly(file_path):
     """Remove readonly attribute from a file"""
     try:
-        if os.path.exists(file_path):
-            # Make file writable
+        # One stat answers both "does it exist" and "is it already writable"
+        # (a missing file raises FileNotFoundError)
+        mode = os.stat(file_path).st_mode
+        # Make file writable (skip the chmod if it already is)
+        if not mode & stat.S_IWRITE:
             os.chmod(file_path, stat.S_IWRITE | stat.S_IREAD)
-            return True
+        return True
     except Exception:
-        pass
-    return False
+        return False
+
+@contextmanager
+def writable_ixp():
+    """
+    Keep IxpSettings.json writable across several saves
+    
+    Saves inside the block skip their readonly toggling; if any of them asked
+    for readonly, it is set once when the outermost block exits.
+    """
+    depth = getattr(_ixp_writable, "depth", 0)
+    if depth == 0:
+        _ixp_writable.readonly_requested = False
+        remove_file_readonly(get_ixp_settings_path())
+    _ixp_writable.depth = depth + 1
+    try:
+        yield
+    finally:
+        _ixp_writable.depth = depth
+        if depth == 0 and _ixp_writable.readonly_requested:
+            set_file_readonly(get_ixp_settings_path())
+
+def finish_ixp_save(ixp_path, set_readonly):
+    """Apply the requested readonly state after a save, deferring it inside writable_ixp()"""
+    if not set_readonly:
+        return
+    if getattr(_ixp_writable, "depth", 0) > 0:
+        _ixp_writable.readonly_requested = True
+    else:
+        set_file_readonly(ixp_path)
 
 def save_ixp_settings(data, set_readonly=True):
     """Save data to IxpSettings.json and optionally set readonly"""
     ixp_path = get_ixp_settings_path()
     settings_dir = get_roblox_settings_path()
     
+    try:
+        payload = encode_json(data)
+    except Exception:
+        return False
+    
+    # Leave the file alone if it already holds exactly this content (compared
+    # against the cached bytes, so an unchanged file is only stat'ed)
+    if cached_json_data(ixp_path, _ixp_cache) is not None and _ixp_cache["raw"] == payload:
+        finish_ixp_save(ixp_path, set_readonly)
+        return True
+    
     # Create directory if it doesn't exist
     os.makedirs(settings_dir, exist_ok=True)
     
-    # Remove readonly if file exists (to allow writing)
-    if os.path.exists(ixp_path):
-        remove_file_readonly(ixp_path)
-    
+    tmp_path = ixp_path + ".tmp"
     try:
-        with open(ixp_path, 'w') as f:
-            json.dump(data, f, indent=4)
+        # Write next to the target and swap it in, so readers never see a half-written file
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        try:
+            os.replace(tmp_path, ixp_path)
+        except PermissionError:
+            # Windows refuses to replace a readonly file
+            remove_file_readonly(ixp_path)
+            os.replace(tmp_path, ixp_path)
+        remember_json(ixp_path, _ixp_cache, data, payload)
         
         # Set readonly after successful write if requested
-        if set_readonly:
-            set_file_readonly(ixp_path)
+        finish_ixp_save(ixp_path, set_readonly)
         
         return True
     except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         return False
 
+def apply_fastflag_batch(flag_updates, tracking_mutator=None):
+    """
+    Apply fastflags and any extra tracking changes in one load/save cycle
+    
+    Args:
+        flag_updates: Dictionary of fastflags to apply
+        tracking_mutator: Optional callable that updates the tracking data in place
+    
+    Returns:
+        dict: Which of the two files were saved
+    """
+    current_settings = load_ixp_settings()
+    
+    with tracking_transaction() as transaction:
+        tracking_data = transaction["data"]
+        
+        # Create backup of current state if we haven't already (snapshot, since
+        # current_settings is updated below)
+        if not tracking_data.get("backup"):
+            tracking_data["backup"] = current_settings.copy()
+            tracking_data["backup_created"] = datetime.now().isoformat()
+        
+        # Apply new fastflags
+        current_settings.update(flag_updates)
+        tracking_data["applied_flags"].update(flag_updates)
+        
+        if tracking_mutator:
+            tracking_mutator(tracking_data)
+        
+        # Only record the flags once they are actually in IxpSettings.json
+        transaction["commit"] = save_ixp_settings(current_settings)
+    
+    return {"ixp_saved": transaction["commit"], "tracking_saved": transaction["saved"]}
+
 def apply_fastflags(fast_flags):
     """
     Apply fastflags to Roblox IxpSettings.json with tracking
@@ -130,31 +336,10 @@ def apply_fastflags(fast_flags):
         return result
     
     try:
-        # Load current IxpSettings
-        current_settings = load_ixp_settings()
-        
-        # Load tracking data
-        tracking_data = load_tracking_data()
+        saved = apply_fastflag_batch(fast_flags)
         
-        # Create backup of current state if we haven't already
-        if not tracking_data.get("backup"):
-            if current_settings:
-                tracking_data["backup"] = current_settings.copy()
-                tracking_data["backup_created"] = datetime.now().isoformat()
-            else:
-                # If no current settings, create empty backup
-                tracking_data["backup"] = {}
-                tracking_data["backup_created"] = datetime.now().isoformat()
-        
-        # Apply new fastflags
-        for flag_name, flag_value in fast_flags.items():
-            current_settings[flag_name] = flag_value
-            tracking_data["applied_flags"][flag_name] = flag_value
-        
-        # Save updated settings
-        if save_ixp_settings(current_settings):
-            # Save tracking data
-            if save_tracking_data(tracking_data):
+        if saved["ixp_saved"]:
+            if saved["tracking_saved"]:
                 result["success"] = True
                 result["applied_flags"] = len(fast_flags)
                 result["message"] = f"Successfully applied {len(fast_flags)} fastflags to Roblox"
@@ -211,14 +396,14 @@ def remove_fastflags(flag_names=None):
             result["message"] = "No matching CDBL fastflags found to remove"
             return result
         
-        # Remove flags from settings
-        removed_count = 0
-        for flag_name in flags_to_remove:
-            if flag_name in current_settings:
-                del current_settings[flag_name]
-                removed_count += 1
-            if flag_name in tracking_data["applied_flags"]:
-                del tracking_data["applied_flags"][flag_name]
+        # Remove flags from settings and tracking in one pass over each dict
+        removal_set = set(flags_to_remove)
+        before_count = len(current_settings)
+        current_settings = {name: value for name, value in current_settings.items() if name not in removal_set}
+        removed_count = before_count - len(current_settings)
+        tracking_data["applied_flags"] = {
+            name: value for name, value in tracking_data["applied_flags"].items() if name not in removal_set
+        }
         
         # Save updated settings
         if save_ixp_settings(current_settings):
@@ -315,6 +500,12 @@ def restore_ixp_settings_permissions():
     
     return result
 
+def format_timestamp(value):
+    """Convert a stored time.time_ns() value to ISO format (older files already hold ISO strings)"""
+    if isinstance(value, int):
+        return datetime.fromtimestamp(value / 1e9).isoformat()
+    return value
+
 def get_applied_fastflags():
     """
     Get list of currently applied CDBL fastflags
@@ -334,7 +525,7 @@ def get_applied_fastflags():
         tracking_data = load_tracking_data()
         result["applied_flags"] = tracking_data["applied_flags"]
         result["count"] = len(tracking_data["applied_flags"])
-        result["last_modified"] = tracking_data["last_modified"]
+        result["last_modified"] = format_timestamp(tracking_data["last_modified"])
         result["success"] = True
         
         if result["count"] > 0:
@@ -371,11 +562,6 @@ def get_current_ixp_settings():
     
     return result
 
-# FastFlag for skybox fix
-FLEASION_FLAG = {
-    "FFlagHttpUseRbxStorage10": "false"
-}
-
 def apply_skybox_fastflag():
     """
     Apply the skybox fix FastFlag with separate tracking
@@ -390,30 +576,14 @@ def apply_skybox_fastflag():
     }
     
     try:
-        # Load current settings and tracking data
-        current_settings = load_ixp_settings()
-        tracking_data = load_tracking_data()
-        
-        # Create backup of current state if we haven't already
-        if not tracking_data["backup"]:
-            tracking_data["backup"] = current_settings.copy()
-        
-        # Apply skybox fastflag
-        flag_name = "FFlagHttpUseRbxStorage10"
-        flag_value = "false"
-        
-        current_settings[flag_name] = flag_value
-        tracking_data["applied_flags"][flag_name] = flag_value
-        
         # Mark that skybox fix is active
-        if "skybox_fix" not in tracking_data:
-            tracking_data["skybox_fix"] = {}
-        tracking_data["skybox_fix"]["active"] = True
-        tracking_data["skybox_fix"]["flag_applied"] = flag_name
+        def mark_active(tracking_data):
+            tracking_data.setdefault("skybox_fix", {}).update({"active": True, "flag_applied": SKYBOX_FLAG_NAME})
         
-        # Save updated settings
-        if save_ixp_settings(current_settings):
-            if save_tracking_data(tracking_data):
+        saved = apply_fastflag_batch(FLEASION_FLAG, mark_active)
+        
+        if saved["ixp_saved"]:
+            if saved["tracking_saved"]:
                 result["success"] = True
                 result["message"] = "Skybox fix FastFlag applied successfully"
             else:
@@ -446,31 +616,30 @@ def remove_skybox_fastflag():
     try:
         # Load current settings and tracking data
         current_settings = load_ixp_settings()
-        tracking_data = load_tracking_data()
-        
-        # Check if skybox fix is active
-        if "skybox_fix" not in tracking_data or not tracking_data["skybox_fix"].get("active", False):
-            result["message"] = "Skybox fix FastFlag is not currently active"
-            return result
-        
-        flag_name = tracking_data["skybox_fix"].get("flag_applied", "FFlagHttpUseRbxStorage10")
-        
-        # Remove flag from settings
-        removed = False
-        if flag_name in current_settings:
-            del current_settings[flag_name]
-            removed = True
         
-        # Remove from tracking
-        if flag_name in tracking_data["applied_flags"]:
-            del tracking_data["applied_flags"][flag_name]
-        
-        # Mark skybox fix as inactive
-        tracking_data["skybox_fix"]["active"] = False
+        with tracking_transaction() as transaction:
+            tracking_data = transaction["data"]
+            
+            # Check if skybox fix is active
+            if "skybox_fix" not in tracking_data or not tracking_data["skybox_fix"].get("active", False):
+                transaction["commit"] = False
+                result["message"] = "Skybox fix FastFlag is not currently active"
+                return result
+            
+            flag_name = tracking_data["skybox_fix"].get("flag_applied", SKYBOX_FLAG_NAME)
+            
+            # Remove flag from settings and tracking
+            current_settings.pop(flag_name, None)
+            tracking_data["applied_flags"].pop(flag_name, None)
+            
+            # Mark skybox fix as inactive
+            tracking_data["skybox_fix"]["active"] = False
+            
+            # Save updated settings; tracking is saved on leaving the block
+            transaction["commit"] = save_ixp_settings(current_settings)
         
-        # Save updated settings
-        if save_ixp_settings(current_settings):
-            if save_tracking_data(tracking_data):
+        if transaction["commit"]:
+            if transaction["saved"]:
                 result["success"] = True
                 result["message"] = f"Skybox fix FastFlag removed successfully"
             else:
@@ -487,6 +656,25 @@ def remove_skybox_fastflag():
     
     return result
 
+def fix_active(fix_key):
+    """
+    Check whether a tracked fix ("skybox_fix" / "no_arms_fix") is active, without building a status message
+    
+    Returns:
+        bool: Whether the fix is active, or None if the tracking file exists but can't be read
+    """
+    tracking_data = peek_tracking_data()
+    # peek_tracking_data returns {} for a missing and for a corrupt file alike;
+    # a failed parse leaves the cache empty while the file is still there
+    if _tracking_cache["data"] is None and os.path.exists(get_cdbl_tracking_path()):
+        return None
+    fix = tracking_data.get(fix_key)
+    return bool(fix and fix.get("active", False))
+
+def skybox_fix_active():
+    """Lightweight skybox fix check for status polling (None if the status can't be read)"""
+    return fix_active("skybox_fix")
+
 def is_skybox_fix_active():
     """
     Check if skybox fix FastFlag is currently active
@@ -502,11 +690,11 @@ def is_skybox_fix_active():
     }
     
     try:
-        tracking_data = load_tracking_data()
+        tracking_data = peek_tracking_data()
         
         if "skybox_fix" in tracking_data:
             result["active"] = tracking_data["skybox_fix"].get("active", False)
-            result["flag_name"] = tracking_data["skybox_fix"].get("flag_applied", "FFlagHttpUseRbxStorage10")
+            result["flag_name"] = tracking_data["skybox_fix"].get("flag_applied", SKYBOX_FLAG_NAME)
         
         result["success"] = True
         if result["active"]:
@@ -534,24 +722,20 @@ def apply_no_arms_fastflag():
     }
     
     try:
-        flag_name = "FFlagHttpUseRbxStorage10"
-        flag_value = "false"
+        flag_name = SKYBOX_FLAG_NAME
+        flag_value = SKYBOX_FLAG_VALUE
         
-        # Apply the FastFlag
-        fastflag_result = apply_fastflags({flag_name: flag_value})
-        if not fastflag_result["success"]:
+        # Apply the FastFlag and mark no arms fix as active in the same save
+        def mark_active(tracking_data):
+            tracking_data.setdefault("no_arms_fix", {}).update({"active": True, "flag_applied": flag_name})
+        
+        saved = apply_fastflag_batch(FLEASION_FLAG, mark_active)
+        if not saved["ixp_saved"]:
             result["message"] = "Failed to apply no arms FastFlag"
-            result["errors"].extend(fastflag_result["errors"])
+            result["errors"].append("Failed to save fastflags to IxpSettings.json")
             return result
         
-        # Update tracking data to mark no arms fix as active
-        tracking_data = load_tracking_data()
-        if "no_arms_fix" not in tracking_data:
-            tracking_data["no_arms_fix"] = {}
-        tracking_data["no_arms_fix"]["active"] = True
-        tracking_data["no_arms_fix"]["flag_applied"] = flag_name
-        
-        if save_tracking_data(tracking_data):
+        if saved["tracking_saved"]:
             result["success"] = True
             result["message"] = f"No arms FastFlag applied successfully ({flag_name}: {flag_value})"
         else:
@@ -579,28 +763,34 @@ def remove_no_arms_fastflag():
     }
     
     try:
-        tracking_data = load_tracking_data()
-        
-        # Check if no arms fix is active
-        if "no_arms_fix" not in tracking_data or not tracking_data["no_arms_fix"].get("active", False):
-            result["message"] = "No arms fix is not currently active"
-            result["errors"].append(result["message"])
-            return result
+        current_settings = load_ixp_settings()
         
-        # Get the flag name that was applied
-        flag_name = tracking_data["no_arms_fix"].get("flag_applied", "FFlagHttpUseRbxStorage10")
+        with tracking_transaction() as transaction:
+            tracking_data = transaction["data"]
+            
+            # Check if no arms fix is active
+            if "no_arms_fix" not in tracking_data or not tracking_data["no_arms_fix"].get("active", False):
+                transaction["commit"] = False
+                result["message"] = "No arms fix is not currently active"
+                result["errors"].append(result["message"])
+                return result
+            
+            # Get the flag name that was applied
+            flag_name = tracking_data["no_arms_fix"].get("flag_applied", SKYBOX_FLAG_NAME)
+            
+            # Remove the FastFlag and mark no arms fix as inactive in the same save
+            current_settings.pop(flag_name, None)
+            tracking_data["applied_flags"].pop(flag_name, None)
+            tracking_data["no_arms_fix"]["active"] = False
+            
+            transaction["commit"] = save_ixp_settings(current_settings)
         
-        # Remove the FastFlag
-        remove_result = remove_fastflags([flag_name])
-        if not remove_result["success"]:
+        if not transaction["commit"]:
             result["message"] = "Failed to remove no arms FastFlag"
-            result["errors"].extend(remove_result["errors"])
+            result["errors"].append("Failed to save updated settings to IxpSettings.json")
             return result
         
-        # Update tracking data to mark no arms fix as inactive
-        tracking_data["no_arms_fix"]["active"] = False
-        
-        if save_tracking_data(tracking_data):
+        if transaction["saved"]:
             result["success"] = True
             result["message"] = f"No arms FastFlag removed successfully ({flag_name})"
         else:
@@ -614,6 +804,11 @@ def remove_no_arms_fastflag():
     return result
 
 
+def no_arms_fix_active():
+    """Lightweight no arms fix check for status polling (None if the status can't be read)"""
+    return fix_active("no_arms_fix")
+
+
 def is_no_arms_fix_active():
     """
     Check if no arms fix FastFlag is currently active
@@ -629,11 +824,11 @@ def is_no_arms_fix_active():
     }
     
     try:
-        tracking_data = load_tracking_data()
+        tracking_data = peek_tracking_data()
         
         if "no_arms_fix" in tracking_data:
             result["active"] = tracking_data["no_arms_fix"].get("active", False)
-            result["flag_name"] = tracking_data["no_arms_fix"].get("flag_applied", "FFlagHttpUseRbxStorage10")
+            result["flag_name"] = tracking_data["no_arms_fix"].get("flag_applied", SKYBOX_FLAG_NAME)
         
         result["success"] = True
         if result["active"]:
@@ -691,8 +886,8 @@ def create_initial_backup():
                 result["errors"].append(result["message"])
                 return result
         
-        # Create backup
-        tracking_data["backup"] = current_settings.copy()
+        # Create backup (current_settings is not touched again before saving)
+        tracking_data["backup"] = current_settings
         tracking_data["backup_created"] = datetime.now().isoformat()
         
         # Save tracking data
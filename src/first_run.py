@@ -5,9 +5,8 @@ Shows loading progress and downloads necessary files on first launch
 
 import os
 import sys
-import json
-import subprocess
-import time
+import copy
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, 
@@ -15,7 +14,25 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, QThread, Signal, QTimer
 from PySide6.QtGui import QTextCursor
-from PySide6.QtGui import QFont, QPixmap
+from src.jsonio import encode_json, decode_json
+
+# CDBL data folder, resolved and created once at import
+CDBL_DIR = Path(os.environ.get("LOCALAPPDATA") or (Path.home() / "AppData" / "Local")) / "CDBL"
+CDBL_DIR.mkdir(parents=True, exist_ok=True)
+CONFIG_FILE = CDBL_DIR / "config.json"
+TRACKING_FILE = CDBL_DIR / "fastflags_tracking.json"
+# Empty marker written once setup is done, so later launches only need a stat
+FIRST_RUN_SENTINEL = CDBL_DIR / ".first_run_done"
+
+# config.json is parsed once per process; save_config keeps it in sync
+_config_cache = {"loaded": False, "data": None}
+
+# Default gun sound skins that assets.json must always contain
+AR_SKIN_SOUNDS = {
+    "AUG": "5bcb64d6269f4c20515e8b7e7cc53504",
+    "Tommy Gun": "5bcb64d6269f4c20515e8b7e7cc53504",
+    "AK47": "5bcb64d6269f4c20515e8b7e7cc53504"
+}
 
 class FirstRunSetupWorker(QThread):
     """Worker thread for first-run setup operations"""
@@ -24,32 +41,41 @@ class FirstRunSetupWorker(QThread):
     
     def __init__(self):
         super().__init__()
+        # New config.json built during setup, written once by mark_setup_complete
+        self.pending_config = None
+        # Other (path, data) JSON files to write in one pass before the config
+        self.pending_writes = []
         
     def run(self):
         """Perform first-run setup tasks"""
         try:
             self.progress.emit(5, "Starting CDBL setup...")
-            time.sleep(0.5)  # Brief pause to show the message
             
-            # Create necessary directories
+            # Create necessary directories (everything below needs them)
             self.progress.emit(15, "Creating directories...")
             self.create_directories()
             
-            # Download assets.json first
-            self.progress.emit(25, "Downloading assets.json...")
-            self.download_assets_json()
-            
-            # Download core files
-            self.progress.emit(45, "Checking and downloading files...")
-            self.download_core_files()
-            
-            # Set up configuration (includes assets.json structure check)
-            self.progress.emit(70, "Setting up configuration...")
-            self.setup_configuration()
-            
-            # Download FastFlags data
-            self.progress.emit(85, "Preparing FastFlags system...")
-            self.setup_fastflags()
+            # Core/archive downloads and the FastFlags backup don't depend on
+            # anything else (or each other), so run them alongside the
+            # assets.json steps
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                # Download core and archive files and prepare FastFlags system
+                self.progress.emit(25, "Checking and downloading files...")
+                downloads = executor.submit(self.download_core_files)
+                archives = executor.submit(self.download_archives)
+                fastflags = executor.submit(self.setup_fastflags)
+                
+                # Download assets.json first, then set up configuration
+                # (includes assets.json structure check)
+                self.progress.emit(35, "Downloading assets.json...")
+                self.download_assets_json()
+                self.progress.emit(70, "Setting up configuration...")
+                self.setup_configuration()
+                
+                self.progress.emit(80, "Waiting for downloads to finish...")
+                downloads.result()
+                archives.result()
+                fastflags.result()
             
             # Mark setup as complete
             self.progress.emit(95, "Finalizing setup...")
@@ -65,14 +91,12 @@ class FirstRunSetupWorker(QThread):
     
     def create_directories(self):
         """Create necessary application directories"""
-        self.progress.emit(20, "Checking directories...")
         from src.core import ensure_directories
         ensure_directories()
     
     def download_assets_json(self):
         """Download assets.json file during first run setup"""
         try:
-            self.progress.emit(30, "Downloading assets.json...")
             from .assets import download_assets_json
             
             assets_path = download_assets_json()
@@ -85,14 +109,18 @@ class FirstRunSetupWorker(QThread):
             print(f"⚠️ Warning: Could not download assets.json: {e}")
     
     def download_core_files(self):
-        """Download essential files and archive files"""
+        """Download essential files"""
         try:
-            self.progress.emit(50, "Downloading core files...")
             from src.core import download_needed_files
             download_needed_files()
             
-            # Download archive files
-            self.progress.emit(60, "Downloading archive files...")
+        except Exception as e:
+            # If download fails, continue - it's not critical for basic operation
+            print(f"Files download warning: {e}")
+    
+    def download_archives(self):
+        """Download and extract the archive files"""
+        try:
             from .assets import download_archive_files
             download_archive_files()
             print("✅ Downloaded all archive files")
@@ -103,26 +131,19 @@ class FirstRunSetupWorker(QThread):
     
     def setup_configuration(self):
         """Set up initial configuration"""
-        self.progress.emit(75, "Setting up configuration...")
-        config_dir = Path.home() / "AppData" / "Local" / "CDBL"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        
-        config_file = config_dir / "config.json"
-        
-        # Only create config if it doesn't exist
-        if not config_file.exists():
-            # Create basic config file
-            config = {
+        # Only create config if it doesn't exist; it is written in
+        # mark_setup_complete together with the completion flag
+        if load_config() is None:
+            # Create basic config
+            self.pending_config = {
                 "version": "1.0.0",
                 "first_run_complete": False,
                 "settings": {
                     "check_for_updates": True,
-                    "auto_detect_client": True
+                    "auto_detect_client": True,
+                    "show_admin_warning": True
                 }
             }
-            
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
         else:
             print("Configuration file already exists, keeping existing settings")
         
@@ -138,51 +159,15 @@ class FirstRunSetupWorker(QThread):
         assets_file = Path(cache_dir) / "assets.json"
         
         # Always ensure the assets.json structure exists and is up to date
-        if assets_file.exists():
+        raw = read_file_bytes(assets_file)
+        if raw is not None:
             try:
-                with open(assets_file, 'r') as f:
-                    assets_data = json.load(f)
-                
-                updated = False
-                
-                # Ensure Rivals structure exists
-                if "Rivals" not in assets_data:
-                    assets_data["Rivals"] = {}
-                    updated = True
-                
-                # Ensure gun sounds exists
-                if "gun sounds" not in assets_data["Rivals"]:
-                    assets_data["Rivals"]["gun sounds"] = {}
-                    updated = True
-                
-                # Add skins structure if missing
-                if "skins" not in assets_data["Rivals"]["gun sounds"]:
-                    assets_data["Rivals"]["gun sounds"]["skins"] = {}
-                    updated = True
-                
-                # Add skin entries
-                skins_data = assets_data["Rivals"]["gun sounds"]["skins"]
-                
-                # Add AR category if missing
-                if "AR" not in skins_data:
-                    skins_data["AR"] = {}
-                    updated = True
-                
-                # Add individual skins
-                ar_skins = {
-                    "AUG": "5bcb64d6269f4c20515e8b7e7cc53504",
-                    "Tommy Gun": "5bcb64d6269f4c20515e8b7e7cc53504",
-                    "AK47": "5bcb64d6269f4c20515e8b7e7cc53504"
-                }
+                assets_data = decode_json(raw)
                 
-                for skin_name, skin_hash in ar_skins.items():
-                    if skin_name not in skins_data["AR"]:
-                        skins_data["AR"][skin_name] = skin_hash
-                        updated = True
+                updated = add_skins_structure(assets_data)
                 
                 if updated:
-                    with open(assets_file, 'w') as f:
-                        json.dump(assets_data, f, indent=4)
+                    self.pending_writes.append((assets_file, assets_data))
                     print(f"✅ Updated assets.json with skins in {cache_dir}")
                 else:
                     print(f"ℹ️ assets.json structure is up to date")
@@ -206,18 +191,13 @@ class FirstRunSetupWorker(QThread):
                 "Rivals": {
                     "gun sounds": {
                         "skins": {
-                            "AR": {
-                                "AUG": "5bcb64d6269f4c20515e8b7e7cc53504",
-                                "Tommy Gun": "5bcb64d6269f4c20515e8b7e7cc53504",
-                                "AK47": "5bcb64d6269f4c20515e8b7e7cc53504"
-                            }
+                            "AR": dict(AR_SKIN_SOUNDS)
                         }
                     }
                 }
             }
             
-            with open(assets_file, 'w') as f:
-                json.dump(assets_data, f, indent=4)
+            self.pending_writes.append((assets_file, assets_data))
             print(f"✅ Created new assets.json with skins structure")
             
         except Exception as e:
@@ -226,10 +206,8 @@ class FirstRunSetupWorker(QThread):
     def setup_fastflags(self):
         """Initialize FastFlags system"""
         try:
-            self.progress.emit(90, "Setting up FastFlags...")
-            
             # Create initial backup of IxpSettings.json
-            from src.fastflags import create_initial_backup
+            from src.fastflags import create_initial_backup, save_tracking_data
             backup_result = create_initial_backup()
             
             if backup_result["success"]:
@@ -238,45 +216,40 @@ class FirstRunSetupWorker(QThread):
                 print(f"⚠️ FastFlags backup warning: {backup_result['message']}")
                 # Continue setup even if backup fails - it's not critical
             
-            # Create FastFlags tracking directory
-            fastflags_dir = Path.home() / "AppData" / "Local" / "CDBL"
-            fastflags_dir.mkdir(parents=True, exist_ok=True)
-            
             # Initialize tracking file if it doesn't exist
-            tracking_file = fastflags_dir / "fastflags_tracking.json"
-            if not tracking_file.exists():
+            if not TRACKING_FILE.exists():
                 tracking_data = {
                     "applied_flags": {},
                     "backup_exists": backup_result["success"],
                     "skybox_fix_active": False
                 }
-                with open(tracking_file, 'w') as f:
-                    json.dump(tracking_data, f, indent=2)
+                # Written through fastflags so its cached view stays in sync
+                if not save_tracking_data(tracking_data):
+                    print("⚠️ Could not create FastFlags tracking file")
             else:
                 print("FastFlags tracking file already exists, keeping existing data")
         except Exception as e:
             print(f"FastFlags setup warning: {e}")
     
+    def write_pending_files(self):
+        """Write the JSON files queued during setup in a single pass"""
+        for file_path, data in self.pending_writes:
+            try:
+                file_path.write_bytes(encode_json(data, compact=True))
+            except Exception as e:
+                # Same as before batching: these files are not critical
+                print(f"⚠️ Error writing {file_path.name}: {e}")
+        self.pending_writes.clear()
+    
     def mark_setup_complete(self):
         """Mark first-run setup as complete"""
-        config_dir = Path.home() / "AppData" / "Local" / "CDBL"
-        config_file = config_dir / "config.json"
+        # Everything else goes to disk before the completion flag does
+        self.write_pending_files()
         
-        # Load existing config or create new one
-        if config_file.exists():
-            try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-            except:
-                # If config is corrupted, create a new one
-                config = {
-                    "version": "1.0.0",
-                    "settings": {
-                        "check_for_updates": True,
-                        "auto_detect_client": True
-                    }
-                }
-        else:
+        # Use the config prepared by setup_configuration, else load the existing
+        # one or create new one (also if it is corrupted)
+        config = self.pending_config or load_config()
+        if not isinstance(config, dict):
             config = {
                 "version": "1.0.0",
                 "settings": {
@@ -289,13 +262,118 @@ class FirstRunSetupWorker(QThread):
         config["first_run_complete"] = True
         
         # Save the updated config
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        if not save_config(config):
+            raise OSError(f"Could not write {CONFIG_FILE}")
+        
+        mark_first_run_done()
 
 
 class FirstRunSetupDialog(QDialog):
     """First-run setup dialog with progress bar"""
     
+    # Stylesheet shared by every instance of the dialog
+    STYLE_SHEET = """
+        QDialog {
+            background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
+                                       stop: 0 #1a1a1a, stop: 1 #2d1b3d);
+            color: #ffffff;
+            border: 2px solid rgba(168, 85, 247, 0.3);
+            border-radius: 12px;
+        }
+        
+        QLabel#setupTitle {
+            color: #A855F7;
+            font-size: 24px;
+            font-weight: 700;
+            margin-bottom: 10px;
+        }
+        
+        QLabel#welcomeText {
+            color: #E5E7EB;
+            font-size: 14px;
+            line-height: 1.5;
+            margin-bottom: 20px;
+        }
+        
+        QLabel#progressLabel {
+            color: #D1D5DB;
+            font-size: 13px;
+            font-weight: 600;
+            margin-bottom: 5px;
+        }
+        
+        QLabel#statusLabel {
+            color: #A855F7;
+            font-size: 12px;
+            margin-top: 10px;
+            font-style: italic;
+        }
+        
+        QProgressBar#setupProgressBar {
+            border: 2px solid rgba(168, 85, 247, 0.3);
+            border-radius: 8px;
+            background: rgba(55, 65, 81, 0.8);
+            text-align: center;
+            font-weight: 600;
+            color: #ffffff;
+            min-height: 25px;
+        }
+        
+        QProgressBar#setupProgressBar::chunk {
+            background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+                                       stop: 0 #A855F7, stop: 1 #8B5CF6);
+            border-radius: 6px;
+            margin: 2px;
+        }
+        
+        QTextEdit#logArea {
+            background: rgba(31, 41, 55, 0.8);
+            border: 1px solid rgba(168, 85, 247, 0.2);
+            border-radius: 6px;
+            color: #E5E7EB;
+            font-family: 'Courier New', monospace;
+            font-size: 11px;
+            padding: 8px;
+        }
+        
+        QPushButton#primaryButton {
+            background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                       stop: 0 #A855F7, stop: 1 #8B5CF6);
+            border: none;
+            border-radius: 8px;
+            color: white;
+            font-weight: 600;
+            font-size: 13px;
+            padding: 12px 24px;
+            min-width: 120px;
+        }
+        
+        QPushButton#primaryButton:hover {
+            background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                       stop: 0 #9333EA, stop: 1 #7C3AED);
+        }
+        
+        QPushButton#primaryButton:pressed {
+            background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                       stop: 0 #7C3AED, stop: 1 #6D28D9);
+        }
+        
+        QPushButton#secondaryButton {
+            background: rgba(55, 65, 81, 0.8);
+            border: 1px solid rgba(168, 85, 247, 0.3);
+            border-radius: 8px;
+            color: #D1D5DB;
+            font-weight: 500;
+            font-size: 12px;
+            padding: 8px 16px;
+        }
+        
+        QPushButton#secondaryButton:hover {
+            background: rgba(75, 85, 99, 0.9);
+            border-color: rgba(168, 85, 247, 0.5);
+        }
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("CDBL - First Run Setup")
@@ -306,20 +384,22 @@ class FirstRunSetupDialog(QDialog):
         self.setWindowFlags(Qt.Dialog | Qt.CustomizeWindowHint | Qt.WindowTitleHint)
         
         self.setup_worker = None
+        
+        # Log lines are buffered and flushed to the log area in one go
+        self.log_buffer = []
+        self.log_flush_timer = QTimer()
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.timeout.connect(self.flush_log)
+        
         self.init_ui()
         self.apply_styles()
         
-        # Auto-start setup after a brief delay
+        # Auto-start setup after a brief delay (the countdown starts it at zero)
         self.countdown_timer = QTimer()
         self.countdown_timer.timeout.connect(self.update_countdown)
         self.countdown_seconds = 2
         self.countdown_timer.start(1000)  # Update every second
         
-        self.auto_start_timer = QTimer()
-        self.auto_start_timer.timeout.connect(self.start_setup)
-        self.auto_start_timer.setSingleShot(True)
-        self.auto_start_timer.start(2000)  # Start after 2 seconds
-        
     def init_ui(self):
         """Initialize the UI"""
         layout = QVBoxLayout()
@@ -364,6 +444,9 @@ class FirstRunSetupDialog(QDialog):
         self.log_area = QTextEdit()
         self.log_area.setObjectName("logArea")
         self.log_area.setMaximumHeight(100)
+        # Keep appends cheap across retries: cap the history, no undo stack
+        self.log_area.document().setMaximumBlockCount(200)
+        self.log_area.setUndoRedoEnabled(False)
         self.log_area.setVisible(False)
         layout.addWidget(self.log_area)
         
@@ -395,136 +478,30 @@ class FirstRunSetupDialog(QDialog):
         
     def apply_styles(self):
         """Apply modern styling to the dialog"""
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                                           stop: 0 #1a1a1a, stop: 1 #2d1b3d);
-                color: #ffffff;
-                border: 2px solid rgba(168, 85, 247, 0.3);
-                border-radius: 12px;
-            }
-            
-            QLabel#setupTitle {
-                color: #A855F7;
-                font-size: 24px;
-                font-weight: 700;
-                margin-bottom: 10px;
-            }
-            
-            QLabel#welcomeText {
-                color: #E5E7EB;
-                font-size: 14px;
-                line-height: 1.5;
-                margin-bottom: 20px;
-            }
-            
-            QLabel#progressLabel {
-                color: #D1D5DB;
-                font-size: 13px;
-                font-weight: 600;
-                margin-bottom: 5px;
-            }
-            
-            QLabel#statusLabel {
-                color: #A855F7;
-                font-size: 12px;
-                margin-top: 10px;
-                font-style: italic;
-            }
-            
-            QProgressBar#setupProgressBar {
-                border: 2px solid rgba(168, 85, 247, 0.3);
-                border-radius: 8px;
-                background: rgba(55, 65, 81, 0.8);
-                text-align: center;
-                font-weight: 600;
-                color: #ffffff;
-                min-height: 25px;
-            }
-            
-            QProgressBar#setupProgressBar::chunk {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                                           stop: 0 #A855F7, stop: 1 #8B5CF6);
-                border-radius: 6px;
-                margin: 2px;
-            }
-            
-            QTextEdit#logArea {
-                background: rgba(31, 41, 55, 0.8);
-                border: 1px solid rgba(168, 85, 247, 0.2);
-                border-radius: 6px;
-                color: #E5E7EB;
-                font-family: 'Courier New', monospace;
-                font-size: 11px;
-                padding: 8px;
-            }
-            
-            QPushButton#primaryButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                           stop: 0 #A855F7, stop: 1 #8B5CF6);
-                border: none;
-                border-radius: 8px;
-                color: white;
-                font-weight: 600;
-                font-size: 13px;
-                padding: 12px 24px;
-                min-width: 120px;
-            }
-            
-            QPushButton#primaryButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                           stop: 0 #9333EA, stop: 1 #7C3AED);
-            }
-            
-            QPushButton#primaryButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                           stop: 0 #7C3AED, stop: 1 #6D28D9);
-            }
-            
-            QPushButton#secondaryButton {
-                background: rgba(55, 65, 81, 0.8);
-                border: 1px solid rgba(168, 85, 247, 0.3);
-                border-radius: 8px;
-                color: #D1D5DB;
-                font-weight: 500;
-                font-size: 12px;
-                padding: 8px 16px;
-            }
-            
-            QPushButton#secondaryButton:hover {
-                background: rgba(75, 85, 99, 0.9);
-                border-color: rgba(168, 85, 247, 0.5);
-            }
-        """)
+        self.setStyleSheet(self.STYLE_SHEET)
     
     def update_countdown(self):
-        """Update countdown timer"""
+        """Update countdown timer and start setup when it runs out"""
         self.countdown_seconds -= 1
         if self.countdown_seconds > 0:
             self.start_btn.setText(f"Starting in {self.countdown_seconds} seconds...")
         else:
-            self.countdown_timer.stop()
-            self.start_btn.setText("Starting...")
+            self.start_setup()
     
     def manual_start_setup(self):
         """Allow manual start of setup (cancels countdown)"""
-        if hasattr(self, 'countdown_timer'):
-            self.countdown_timer.stop()
-        if hasattr(self, 'auto_start_timer'):
-            self.auto_start_timer.stop()
         self.start_setup()
     
     def start_setup(self):
         """Start the setup process"""
-        # Stop timers if they're still running
+        # Stop the countdown if it's still running
         if hasattr(self, 'countdown_timer'):
             self.countdown_timer.stop()
-        if hasattr(self, 'auto_start_timer'):
-            self.auto_start_timer.stop()
             
         self.start_btn.setEnabled(False)
         self.start_btn.setText("Setting up...")
         self.show_log_btn.setVisible(True)
+        self.progress_bar.setValue(0)
         
         # Start the setup worker
         self.setup_worker = FirstRunSetupWorker()
@@ -534,17 +511,26 @@ class FirstRunSetupDialog(QDialog):
     
     def update_progress(self, percentage, message):
         """Update progress bar and status"""
-        self.progress_bar.setValue(percentage)
+        # Stages run concurrently, so keep the bar from jumping backwards
+        self.progress_bar.setValue(max(self.progress_bar.value(), percentage))
         self.status_label.setText(message)
         
-        # Add to log
-        log_message = f"[{percentage:3d}%] {message}"
-        self.log_area.append(log_message)
+        # Add to log (flushed within 50ms so bursts only relayout once)
+        self.log_buffer.append(f"[{percentage:3d}%] {message}")
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start(50)
+    
+    def flush_log(self):
+        """Write buffered log lines to the log area and scroll to the end"""
+        self.log_flush_timer.stop()
+        if not self.log_buffer:
+            return
+        
+        self.log_area.append("\n".join(self.log_buffer))
+        self.log_buffer.clear()
         
         # Auto-scroll log
-        cursor = self.log_area.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.log_area.setTextCursor(cursor)
+        self.log_area.moveCursor(QTextCursor.MoveOperation.End)
     
     def setup_finished(self, success, message):
         """Handle setup completion"""
@@ -585,6 +571,7 @@ class FirstRunSetupDialog(QDialog):
             
         else:
             self.status_label.setText("Setup failed!")
+            self.flush_log()
             self.log_area.append(f"\n❌ {message}")
             
             # Make sure log area is visible to show the error
@@ -614,20 +601,91 @@ class FirstRunSetupDialog(QDialog):
         QApplication.quit()
 
 
-def is_first_run():
-    """Check if this is the first run of CDBL"""
-    config_dir = Path.home() / "AppData" / "Local" / "CDBL"
-    config_file = config_dir / "config.json"
+def read_file_bytes(file_path):
+    """
+    Read a small file with a single open, fstat and read
     
-    if not config_file.exists():
-        return True
+    Args:
+        file_path: Path of the file to read
+        
+    Returns:
+        bytes or None: The file content, None if the file does not exist
+    """
+    try:
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except FileNotFoundError:
+        return None
     
     try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-        return not config.get("first_run_complete", False)
-    except:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+def load_config():
+    """
+    Load config.json, parsing it only once per process
+    
+    Returns:
+        dict or None: A private copy of the config, None if missing or unreadable
+    """
+    if not _config_cache["loaded"]:
+        try:
+            raw = read_file_bytes(CONFIG_FILE)
+            _config_cache["data"] = decode_json(raw) if raw is not None else None
+        except Exception:
+            _config_cache["data"] = None
+        _config_cache["loaded"] = True
+    
+    # Callers modify what they get back before saving, so hand out a copy
+    return copy.deepcopy(_config_cache["data"])
+
+
+def save_config(config):
+    """
+    Write config.json atomically and update the in-memory copy
+    
+    Args:
+        config: The full config dict to store
+        
+    Returns:
+        bool: True if saved successfully, False otherwise
+    """
+    tmp_file = CONFIG_FILE.with_suffix(".json.tmp")
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(encode_json(config, compact=True))
+        os.replace(tmp_file, CONFIG_FILE)
+    except Exception as e:
+        print(f"Error saving config: {e}")
+        return False
+    
+    _config_cache["data"] = copy.deepcopy(config)
+    _config_cache["loaded"] = True
+    return True
+
+
+def mark_first_run_done():
+    """Create the first-run sentinel file (failure only costs a config parse later)"""
+    try:
+        FIRST_RUN_SENTINEL.touch()
+    except Exception as e:
+        print(f"⚠️ Could not create first-run marker: {e}")
+
+
+def is_first_run():
+    """Check if this is the first run of CDBL"""
+    if FIRST_RUN_SENTINEL.exists():
+        return False
+    
+    # Setups completed before the sentinel existed only have the config flag
+    config = load_config()
+    if not isinstance(config, dict):
         return True
+    if config.get("first_run_complete", False):
+        mark_first_run_done()
+        return False
+    return True
 
 
 def show_first_run_setup(parent=None):
@@ -645,19 +703,10 @@ def get_license_key():
     Returns:
         str or None: License key if exists, None otherwise
     """
-    config_dir = Path.home() / "AppData" / "Local" / "CDBL"
-    config_file = config_dir / "config.json"
-    
-    if not config_file.exists():
-        return None
-    
-    try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-        return config.get("license_key", None)
-    except Exception as e:
-        print(f"Error reading license key: {e}")
+    config = load_config()
+    if not isinstance(config, dict):
         return None
+    return config.get("license_key", None)
 
 
 def save_license_key(license_key: str):
@@ -670,25 +719,9 @@ def save_license_key(license_key: str):
     Returns:
         bool: True if saved successfully, False otherwise
     """
-    config_dir = Path.home() / "AppData" / "Local" / "CDBL"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    config_file = config_dir / "config.json"
-    
     # Load existing config or create new one
-    if config_file.exists():
-        try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-        except:
-            config = {
-                "version": "1.0.0",
-                "first_run_complete": False,
-                "settings": {
-                    "check_for_updates": True,
-                    "auto_detect_client": True
-                }
-            }
-    else:
+    config = load_config()
+    if not isinstance(config, dict):
         config = {
             "version": "1.0.0",
             "first_run_complete": False,
@@ -701,18 +734,133 @@ def save_license_key(license_key: str):
     # Save the license key
     config["license_key"] = license_key
     
-    try:
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+    return save_config(config)
+
+
+def get_show_admin_warning():
+    """
+    Check whether the non-admin warning popup should be shown
+
+    Returns:
+        bool: True unless the user opted out via "Don't show again"
+    """
+    config = load_config()
+    if not isinstance(config, dict):
         return True
-    except Exception as e:
-        print(f"Error saving license key: {e}")
-        return False
+    return config.get("settings", {}).get("show_admin_warning", True)
+
+
+def set_show_admin_warning(show: bool):
+    """
+    Persist whether the non-admin warning popup should be shown
+
+    Args:
+        show: False to stop showing the popup on later launches
+
+    Returns:
+        bool: True if saved successfully, False otherwise
+    """
+    config = load_config()
+    if not isinstance(config, dict):
+        config = {}
+
+    config.setdefault("settings", {})["show_admin_warning"] = show
+
+    return save_config(config)
 
 
 class UpdateAvailableDialog(QDialog):
     """Dialog shown when an update is available"""
     
+    # Stylesheet shared by every instance of the dialog
+    STYLE_SHEET = """
+        QDialog {
+            background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
+                                       stop: 0 #1a1a1a, stop: 1 #2d1b3d);
+            color: #ffffff;
+            border: 2px solid rgba(168, 85, 247, 0.3);
+            border-radius: 12px;
+        }
+        
+        #setupTitle {
+            font-size: 28px;
+            font-weight: bold;
+            color: #a855f7;
+            margin-bottom: 10px;
+        }
+        
+        #welcomeText {
+            font-size: 14px;
+            color: #e5e5e5;
+            line-height: 1.6;
+        }
+        
+        #progressLabel {
+            font-size: 13px;
+            font-weight: 600;
+            color: #c084fc;
+            margin-top: 5px;
+        }
+        
+        #statusLabel {
+            font-size: 12px;
+            color: #d1d5db;
+            font-style: italic;
+        }
+        
+        #logArea {
+            background-color: rgba(0, 0, 0, 0.3);
+            border: 1px solid rgba(168, 85, 247, 0.2);
+            border-radius: 6px;
+            padding: 10px;
+            font-family: 'Consolas', 'Courier New', monospace;
+            font-size: 11px;
+            color: #e5e5e5;
+        }
+        
+        #primaryButton {
+            background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+                                       stop: 0 #7c3aed, stop: 1 #a855f7);
+            color: white;
+            border: none;
+            padding: 10px 24px;
+            border-radius: 6px;
+            font-size: 13px;
+            font-weight: 600;
+            min-width: 140px;
+        }
+        
+        #primaryButton:hover {
+            background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+                                       stop: 0 #6d28d9, stop: 1 #9333ea);
+        }
+        
+        #primaryButton:pressed {
+            background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+                                       stop: 0 #5b21b6, stop: 1 #7e22ce);
+        }
+        
+        #secondaryButton {
+            background-color: rgba(75, 85, 99, 0.8);
+            color: white;
+            border: 1px solid rgba(156, 163, 175, 0.3);
+            padding: 10px 24px;
+            border-radius: 6px;
+            font-size: 13px;
+            font-weight: 600;
+            min-width: 100px;
+        }
+        
+        #secondaryButton:hover {
+            background-color: rgba(107, 114, 128, 0.9);
+            border-color: rgba(168, 85, 247, 0.4);
+        }
+        
+        #secondaryButton:pressed {
+            background-color: rgba(55, 65, 81, 0.9);
+        }
+    """
+    
     def __init__(self, update_info, parent=None):
         super().__init__(parent)
         self.update_info = update_info
@@ -792,93 +940,7 @@ class UpdateAvailableDialog(QDialog):
         
     def apply_styles(self):
         """Apply modern styling to the dialog"""
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                                           stop: 0 #1a1a1a, stop: 1 #2d1b3d);
-                color: #ffffff;
-                border: 2px solid rgba(168, 85, 247, 0.3);
-                border-radius: 12px;
-            }
-            
-            #setupTitle {
-                font-size: 28px;
-                font-weight: bold;
-                color: #a855f7;
-                margin-bottom: 10px;
-            }
-            
-            #welcomeText {
-                font-size: 14px;
-                color: #e5e5e5;
-                line-height: 1.6;
-            }
-            
-            #progressLabel {
-                font-size: 13px;
-                font-weight: 600;
-                color: #c084fc;
-                margin-top: 5px;
-            }
-            
-            #statusLabel {
-                font-size: 12px;
-                color: #d1d5db;
-                font-style: italic;
-            }
-            
-            #logArea {
-                background-color: rgba(0, 0, 0, 0.3);
-                border: 1px solid rgba(168, 85, 247, 0.2);
-                border-radius: 6px;
-                padding: 10px;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 11px;
-                color: #e5e5e5;
-            }
-            
-            #primaryButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                                           stop: 0 #7c3aed, stop: 1 #a855f7);
-                color: white;
-                border: none;
-                padding: 10px 24px;
-                border-radius: 6px;
-                font-size: 13px;
-                font-weight: 600;
-                min-width: 140px;
-            }
-            
-            #primaryButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                                           stop: 0 #6d28d9, stop: 1 #9333ea);
-            }
-            
-            #primaryButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                                           stop: 0 #5b21b6, stop: 1 #7e22ce);
-            }
-            
-            #secondaryButton {
-                background-color: rgba(75, 85, 99, 0.8);
-                color: white;
-                border: 1px solid rgba(156, 163, 175, 0.3);
-                padding: 10px 24px;
-                border-radius: 6px;
-                font-size: 13px;
-                font-weight: 600;
-                min-width: 100px;
-            }
-            
-            #secondaryButton:hover {
-                background-color: rgba(107, 114, 128, 0.9);
-                border-color: rgba(168, 85, 247, 0.4);
-            }
-            
-            #secondaryButton:pressed {
-                background-color: rgba(55, 65, 81, 0.9);
-            }
-        """)
+        self.setStyleSheet(self.STYLE_SHEET)
     
     def open_download(self):
         """Open the download page"""
@@ -907,7 +969,7 @@ def check_for_updates_on_startup():
         from src.update import check_for_updates
         
         print("Checking for updates...")
-        update_info = check_for_updates(timeout=5)
+        update_info = check_for_updates()
         
         if update_info.get('error'):
             print(f"Update check failed: {update_info['error']}")
@@ -936,6 +998,31 @@ def check_for_updates_on_startup():
         return None
 
 
+def add_skins_structure(assets_data):
+    """
+    Add the Rivals gun sound skins structure to assets.json data if missing
+    
+    Args:
+        assets_data: Parsed assets.json content, updated in place
+        
+    Returns:
+        bool: True if anything was added and the file needs saving
+    """
+    # If the AR category exists, every level above it does too
+    had_ar = "AR" in assets_data.get("Rivals", {}).get("gun sounds", {}).get("skins", {})
+    
+    ar_skins = (
+        assets_data.setdefault("Rivals", {})
+        .setdefault("gun sounds", {})
+        .setdefault("skins", {})
+        .setdefault("AR", {})
+    )
+    missing = {name: skin_hash for name, skin_hash in AR_SKIN_SOUNDS.items() if name not in ar_skins}
+    ar_skins.update(missing)
+    
+    return not had_ar or bool(missing)
+
+
 def ensure_assets_json_structure():
     """
     Ensure assets.json structure exists on every launch
@@ -949,51 +1036,16 @@ def ensure_assets_json_structure():
         assets_file = Path(cache_dir) / "assets.json"
         
         # Always ensure the assets.json structure exists and is up to date
-        if assets_file.exists():
+        raw = read_file_bytes(assets_file)
+        if raw is not None:
             try:
-                with open(assets_file, 'r') as f:
-                    assets_data = json.load(f)
+                assets_data = decode_json(raw)
                 
-                updated = False
-                
-                # Ensure Rivals structure exists
-                if "Rivals" not in assets_data:
-                    assets_data["Rivals"] = {}
-                    updated = True
-                
-                # Ensure gun sounds exists
-                if "gun sounds" not in assets_data["Rivals"]:
-                    assets_data["Rivals"]["gun sounds"] = {}
-                    updated = True
-                
-                # Add skins structure if missing
-                if "skins" not in assets_data["Rivals"]["gun sounds"]:
-                    assets_data["Rivals"]["gun sounds"]["skins"] = {}
-                    updated = True
-                
-                # Add skin entries
-                skins_data = assets_data["Rivals"]["gun sounds"]["skins"]
-                
-                # Add AR category if missing
-                if "AR" not in skins_data:
-                    skins_data["AR"] = {}
-                    updated = True
-                
-                # Add individual skins
-                ar_skins = {
-                    "AUG": "5bcb64d6269f4c20515e8b7e7cc53504",
-                    "Tommy Gun": "5bcb64d6269f4c20515e8b7e7cc53504",
-                    "AK47": "5bcb64d6269f4c20515e8b7e7cc53504"
-                }
-                
-                for skin_name, skin_hash in ar_skins.items():
-                    if skin_name not in skins_data["AR"]:
-                        skins_data["AR"][skin_name] = skin_hash
-                        updated = True
+                updated = add_skins_structure(assets_data)
                 
                 if updated:
-                    with open(assets_file, 'w') as f:
-                        json.dump(assets_data, f, indent=4)
+                    with open(assets_file, 'wb') as f:
+                        f.write(encode_json(assets_data, compact=True))
                     print(f"✅ Updated assets.json structure on launch")
                 
             except Exception as e:
@@ -1019,18 +1071,14 @@ def create_new_assets_json_file(assets_file):
             "Rivals": {
                 "gun sounds": {
                     "skins": {
-                        "AR": {
-                            "AUG": "5bcb64d6269f4c20515e8b7e7cc53504",
-                            "Tommy Gun": "5bcb64d6269f4c20515e8b7e7cc53504",
-                            "AK47": "5bcb64d6269f4c20515e8b7e7cc53504"
-                        }
+                        "AR": dict(AR_SKIN_SOUNDS)
                     }
                 }
             }
         }
         
-        with open(assets_file, 'w') as f:
-            json.dump(assets_data, f, indent=4)
+        with open(assets_file, 'wb') as f:
+            f.write(encode_json(assets_data, compact=True))
         print(f"✅ Created new assets.json with required structure")
         
     except Exception as e:
@@ -1044,52 +1092,9 @@ def remove_license_key():
     Returns:
         bool: True if removed successfully, False otherwise
     """
-    config_dir = Path.home() / "AppData" / "Local" / "CDBL"
-    config_file = config_dir / "config.json"
-    
-    if not config_file.exists():
+    config = load_config()
+    if not isinstance(config, dict) or "license_key" not in config:
         return True  # Nothing to remove
     
-    try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-        
-        # Remove license key if it exists
-        if "license_key" in config:
-            del config["license_key"]
-            
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
-        return True
-    except Exception as e:
-        print(f"Error removing license key: {e}")
-        return False
-
-
-def remove_license_key():
-    """
-    Remove license key from config
-    
-    Returns:
-        bool: True if removed successfully, False otherwise
-    """
-    config_dir = Path.home() / "AppData" / "Local" / "CDBL"
-    config_file = config_dir / "config.json"
-    
-    if not config_file.exists():
-        return True  # Nothing to remove
-    
-    try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-        
-        # Remove license key if it exists
-        if "license_key" in config:
-            del config["license_key"]
-            
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
-        return True
-    except Exception as e:
-        print(f"Error removing license key: {e}")
-        return False
\ No newline at end of file
+    del config["license_key"]
+    return save_config(config)
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""
+CDBL JSON I/O Helpers
+Shared JSON encoding/decoding for the config, tracking and settings files
+"""
+
+import json
+
+# orjson is optional - it parses and serializes much faster than the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def encode_json(data, compact=False):
+    """Serialize data to JSON bytes, indented with 2 spaces unless compact is set"""
+    if ORJSON_AVAILABLE:
+        if compact:
+            return orjson.dumps(data)
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    # Same layout as orjson so the files don't change with the installed packages
+    if compact:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def decode_json(raw):
+    """Parse JSON from bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -9,7 +9,8 @@ import requests
 import json
 from .core import (
     cdbl_skybox_data_path, cdbl_skybox_pngs_path, cdbl_skybox_skys_path,
-    cdbl_skybox_patch_path, download_and_extract, download_and_extract_with_progress, get_versions_path
+    cdbl_skybox_patch_path, download_and_extract, download_and_extract_with_progress, get_versions_path,
+    get_sky_list
 )
 from .cache import skybox_cache, popular_cache, preview_cache, api_rate_limiter
 
@@ -299,11 +300,11 @@ def make_skyname_list(force_local=False):
     sky_list_file = os.path.join(cdbl_skybox_data_path, 'Sky-list.txt')
     local_skyboxes = []
     
-    # First, try to load from Sky-list.txt
-    if os.path.exists(sky_list_file):
+    # First, try to load from Sky-list.txt (parsed once per file version)
+    sky_list = get_sky_list()
+    if sky_list is not None:
         print("📁 Loading skyboxes from Old API Sky-list.txt")
-        with open(sky_list_file, 'r', encoding='utf-8') as f:
-            local_skyboxes = [line.strip().replace(" ", "") for line in f if line.strip()]
+        local_skyboxes = [line.replace(" ", "") for line in sky_list]
     else:
         print(f"Sky-list.txt not found at {sky_list_file}")
     
@@ -3,10 +3,11 @@ CDBL Update Checker Module
 Checks for updates using GitHub Releases API
 """
 
-import requests
-import webbrowser
-from packaging import version
 import json
+import os
+
+# requests, packaging and webbrowser are imported where they are used so that
+# reading APP_VERSION at startup doesn't load the HTTP stack
 
 # ========== Version Data ==========
 APP_VERSION = "1.7-Beta"  # your current version
@@ -14,13 +15,43 @@ GITHUB_USERNAME = "eman225511"  # your GitHub username
 GITHUB_REPO = "CDBL"  # your repo name
 GITHUB_RELEASES_API = f"https://api.github.com/repos/{GITHUB_USERNAME}/{GITHUB_REPO}/releases/latest"
 
+# GitHub API timeouts: an unreachable server fails on connect quickly, while
+# a slow response still gets the full read timeout
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 5.0
+# Users on slow networks can raise the default read timeout with this env var
+UPDATE_TIMEOUT_ENV = "CDBL_UPDATE_TIMEOUT"
+
+
+def get_request_timeout(read_timeout=None):
+    """
+    Build the (connect, read) timeout used for GitHub API requests
+    
+    Args:
+        read_timeout: Read timeout in seconds. If None, CDBL_UPDATE_TIMEOUT
+            is used when set to a positive number, otherwise READ_TIMEOUT
+        
+    Returns:
+        tuple: (connect timeout, read timeout) for requests
+    """
+    if read_timeout is None:
+        read_timeout = READ_TIMEOUT
+        override = os.environ.get(UPDATE_TIMEOUT_ENV)
+        if override:
+            try:
+                if float(override) > 0:
+                    read_timeout = float(override)
+            except ValueError:
+                print(f"Ignoring invalid {UPDATE_TIMEOUT_ENV} value: {override}")
+    return (min(CONNECT_TIMEOUT, read_timeout), read_timeout)
+
 
-def check_for_updates(timeout=5):
+def check_for_updates(timeout=None):
     """
     Check for updates using GitHub Releases API
     
     Args:
-        timeout: Request timeout in seconds
+        timeout: Read timeout in seconds (see get_request_timeout)
         
     Returns:
         dict: Update information with keys:
@@ -42,9 +73,12 @@ def check_for_updates(timeout=5):
         "error": None
     }
     
+    import requests
+    from packaging import version
+    
     try:
         # Make request to GitHub API
-        response = requests.get(GITHUB_RELEASES_API, timeout=timeout)
+        response = requests.get(GITHUB_RELEASES_API, timeout=get_request_timeout(timeout))
         response.raise_for_status()
         
         release_data = response.json()
@@ -104,6 +138,7 @@ def check_for_updates(timeout=5):
 
 def open_release_page():
     """Open the latest release page in the default browser"""
+    import webbrowser
     release_url = f"https://7xeh.dev/apps/cdbl/"
     webbrowser.open(release_url)
 
@@ -116,6 +151,7 @@ def open_download_url(url):
         url: The download URL to open
     """
     if url:
+        import webbrowser
         webbrowser.open(url)
 
 
@@ -124,19 +160,20 @@ def get_version():
     return APP_VERSION
 
 
-def get_all_releases(timeout=5):
+def get_all_releases(timeout=None):
     """
     Get all releases from GitHub
     
     Args:
-        timeout: Request timeout in seconds
+        timeout: Read timeout in seconds (see get_request_timeout)
         
     Returns:
         list: List of release objects, or None if failed
     """
     try:
+        import requests
         api_url = f"https://api.github.com/repos/{GITHUB_USERNAME}/{GITHUB_REPO}/releases"
-        response = requests.get(api_url, timeout=timeout)
+        response = requests.get(api_url, timeout=get_request_timeout(timeout))
         response.raise_for_status()
         return response.json()
     except Exception as e: